@@ -9,19 +9,27 @@ astrophysical parameters. These include fetching planetary gravity
 or return the position and velocity from an orbit.
 """
 
+import math
 import numpy as np
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Tuple
 from . import constants
 from . import utils
 from .kinematics import euler2, euler3
-from .utils import normalize_angle
+from .utils import normalize_angle, fast_sin, fast_cos
 from ..utils import NominalException
 
 
+_TWO_PI: float = 2 * math.pi
+
+
+@lru_cache(maxsize=None)
 def get_planet_property (planet: str, property: str) -> float:
     """
     Returns the planet's property. If the planet does not exist,
-    then an exception will be thrown.
+    then an exception will be thrown. Results are cached, as the
+    planet constants do not change at runtime.
 
     :param planet:      The name of the planet to fetch the property from
     :type planet:       str
@@ -52,13 +60,34 @@ def get_planet_mu (planet: str) -> float:
     :returns:       The gravitational MU parameter
     :rtype:         float
     """
-    return get_planet_property(planet, "MU")
+    mu = constants.PLANET_MU.get(planet.lower())
+    if mu is None:
+        raise NominalException(f"No planet: {planet} with property MU.")
+    return mu
+
+
+def get_planet_mu_id (planet_id: int) -> float:
+    """
+    Returns the planet's gravitational mu parameter from the planet's
+    integer ID in the constants planet tables, see constants.PLANET_ID.
+    This avoids the string lookup for batch calculations that already
+    hold the ID.
+
+    :param planet_id:   The integer ID of the planet
+    :type planet_id:    int
+
+    :returns:           The gravitational MU parameter
+    :rtype:             float
+    """
+    return float(constants.PLANET_MU_ARR[planet_id])
 
 
 def t_perifocal_to_vector_elements (
     right_ascension: float = 0,
     argument_of_periapsis: float = 0,
-    inclination: float = 0
+    inclination: float = 0,
+    sin_cos: tuple = None,
+    out: np.ndarray = None
 )-> np.ndarray:
     """
     Creates the transformation matrix to convert perifocal coordinates into
@@ -78,22 +107,38 @@ def t_perifocal_to_vector_elements (
     :type argument_of_periapsis:    float
     :param inclination:             The orbital inclination in radians
     :type inclination:              float
+    :param sin_cos:                 Optional precomputed (sin, cos) of each angle, flattened in the order
+                                    (right ascension, argument of periapsis, inclination). When given, the
+                                    angles themselves are ignored and no trigonometric functions are evaluated.
+    :type sin_cos:                  tuple
+    :param out:                     Optional 3x3 float64 buffer to fill and return instead of allocating a new matrix
+    :type out:                      numpy.ndarray
 
     :returns:                       A 3x3 numpy matrix representing the transformation from perifocal to ECI coordinates.
     :rtype:                         numpy.matrix
     """
 
-    c_raan = np.cos(right_ascension)
-    c_aop = np.cos(argument_of_periapsis)
-    c_inc = np.cos(inclination)
-    s_raan = np.sin(right_ascension)
-    s_aop = np.sin(argument_of_periapsis)
-    s_inc = np.sin(inclination)
-    TIP = np.array([
-        [c_aop * c_raan - s_aop * c_inc * s_raan, -s_aop * c_raan - c_aop * c_inc * s_raan, s_raan * s_inc],
-        [c_aop * s_raan + s_aop * c_inc * c_raan, c_aop * c_inc * c_raan - s_aop * s_raan, -c_raan * s_inc],
-        [s_aop * s_inc, c_aop * s_inc, c_inc]
-    ], dtype=np.float64)
+    if sin_cos is None:
+        c_raan = math.cos(right_ascension)
+        c_aop = math.cos(argument_of_periapsis)
+        c_inc = math.cos(inclination)
+        s_raan = math.sin(right_ascension)
+        s_aop = math.sin(argument_of_periapsis)
+        s_inc = math.sin(inclination)
+    else:
+        s_raan, c_raan, s_aop, c_aop, s_inc, c_inc = sin_cos
+
+    # fill the matrix element-wise, reusing the buffer if one is given
+    TIP = np.empty((3, 3), dtype=np.float64) if out is None else out
+    TIP[0, 0] = c_aop * c_raan - s_aop * c_inc * s_raan
+    TIP[0, 1] = -s_aop * c_raan - c_aop * c_inc * s_raan
+    TIP[0, 2] = s_raan * s_inc
+    TIP[1, 0] = c_aop * s_raan + s_aop * c_inc * c_raan
+    TIP[1, 1] = c_aop * c_inc * c_raan - s_aop * s_raan
+    TIP[1, 2] = -c_raan * s_inc
+    TIP[2, 0] = s_aop * s_inc
+    TIP[2, 1] = c_aop * s_inc
+    TIP[2, 2] = c_inc
     return TIP
 
 
@@ -129,19 +174,16 @@ def perifocal_to_vector_elements(
     :returns:                       Tuple of transformed position and velocity vectors in ECI coordinates.
     :rtype:                         (numpy.ndarray, numpy.ndarray)
     """
-    # ensure that the input arrays are of type float
-    r_bp_p = r_bp_p.astype(np.float64)
-    v_bp_p = v_bp_p.astype(np.float64)
     # calculate the transformation matrix
     TIP = t_perifocal_to_vector_elements(
         right_ascension=right_ascension,
         argument_of_periapsis=argument_of_periapsis,
         inclination=inclination
     )
-    # perform that matrix multiplication assuming that the position and velocity vector are 3x1 vectors
-    r_bn_n = TIP @ r_bp_p
-    v_bn_n = TIP @ v_bp_p
-    return r_bn_n, v_bn_n
+    # stack the position and velocity as float rows and rotate both with a single matrix product. the vectors are
+    #   flattened first so that 3x1 column vectors are accepted, and the results are returned in the input shapes
+    rv_bn_n = np.array((np.ravel(r_bp_p), np.ravel(v_bp_p)), dtype=np.float64) @ TIP.T
+    return rv_bn_n[0].reshape(np.shape(r_bp_p)), rv_bn_n[1].reshape(np.shape(v_bp_p))
 
 
 def semi_latus_rectum_to_vector_elements(
@@ -151,7 +193,9 @@ def semi_latus_rectum_to_vector_elements(
     right_ascension: float = 0.0,
     argument_of_periapsis: float = 0.0,
     true_anomaly: float = 0.0,
-    planet: str = "earth"
+    planet: str = "earth",
+    sin_cos: tuple = None,
+    mu: float = None
 ) -> tuple:
     """
     Transforms Keplerian orbital elements into position and velocity in Planet-Centered
@@ -179,37 +223,79 @@ def semi_latus_rectum_to_vector_elements(
     :type true_anomaly:             float
     :param planet:                  Name of the central body being orbited (default "earth")
     :type planet:                   str
+    :param sin_cos:                 Optional precomputed (sin, cos) of each angle, flattened in the order
+                                    (inclination, right ascension, argument of periapsis, true anomaly). When
+                                    given, the angles themselves are ignored and no trigonometric functions are
+                                    evaluated, which suits propagators that already hold these terms.
+    :type sin_cos:                  tuple
+    :param mu:                      Optional gravitational parameter of the central body in m^3/s^2. When given,
+                                    the planet is not looked up.
+    :type mu:                       float
 
     :returns:                       A tuple containing position and velocity vectors in PCI coordinates
     :rtype:                         tuple
     """
 
-    # find the gravitational parameter for the planet
-    mu: float = get_planet_mu(planet)
-    # position and velocity in perifocal coordinates
-    denom = 1 + eccentricity * np.cos(true_anomaly)
-    # calculate the perifocal position and velocity
-    r_bp_p = np.array([
-        semi_latus_rectum * np.cos(true_anomaly) / denom,
-        semi_latus_rectum * np.sin(true_anomaly) / denom,
-        0
-    ], dtype=np.float64)
-    rat = np.sqrt(mu / semi_latus_rectum)
-    v_bp_p = np.array([
-        -rat * np.sin(true_anomaly),
-        rat * (eccentricity + np.cos(true_anomaly)),
-        0
-    ], dtype=np.float64)
-    # calculate the pci position and velocity
-    return perifocal_to_vector_elements(
-        r_bp_p=r_bp_p,
-        v_bp_p=v_bp_p,
-        right_ascension=right_ascension,
-        argument_of_periapsis=argument_of_periapsis,
-        inclination=inclination
+    # find the gravitational parameter for the planet, unless the caller already has it
+    if mu is None:
+        mu = get_planet_mu(planet)
+    # calculate the trigonometric terms of each angle, unless the caller already has them
+    if sin_cos is None:
+        c_nu = math.cos(true_anomaly)
+        s_nu = math.sin(true_anomaly)
+        c_raan = math.cos(right_ascension)
+        s_raan = math.sin(right_ascension)
+        c_aop = math.cos(argument_of_periapsis)
+        s_aop = math.sin(argument_of_periapsis)
+        c_inc = math.cos(inclination)
+        s_inc = math.sin(inclination)
+    else:
+        s_inc, c_inc, s_raan, c_raan, s_aop, c_aop, s_nu, c_nu = sin_cos
+    return _semi_latus_rectum_to_vector_elements(
+        semi_latus_rectum, eccentricity, mu, s_inc, c_inc, s_raan, c_raan, s_aop, c_aop, s_nu, c_nu
     )
 
 
+def _semi_latus_rectum_to_vector_elements(
+    semi_latus_rectum: float,
+    eccentricity: float,
+    mu: float,
+    s_inc: float,
+    c_inc: float,
+    s_raan: float,
+    c_raan: float,
+    s_aop: float,
+    c_aop: float,
+    s_nu: float,
+    c_nu: float,
+    r_out: np.ndarray = None,
+    v_out: np.ndarray = None
+) -> tuple:
+    """
+    The scalar kernel of semi_latus_rectum_to_vector_elements, taking the gravitational
+    parameter and the sine and cosine of each angle directly. The state is written into
+    the output buffers if they are given, otherwise new arrays are allocated.
+    """
+    # the argument of latitude u = aop + nu, from the angle addition identities
+    c_u = c_aop * c_nu - s_aop * s_nu
+    s_u = s_aop * c_nu + c_aop * s_nu
+    # the perifocal state has no out-of-plane component, so rather than building it and rotating it by the full
+    #   perifocal to pci matrix, the rotated pci components are written out directly
+    r_mag = semi_latus_rectum / (1 + eccentricity * c_nu)
+    rat = math.sqrt(mu / semi_latus_rectum)
+    e_c = c_u + eccentricity * c_aop
+    e_s = s_u + eccentricity * s_aop
+    r_bn_n = np.empty(3, dtype=np.float64) if r_out is None else r_out
+    v_bn_n = np.empty(3, dtype=np.float64) if v_out is None else v_out
+    r_bn_n[0] = r_mag * (c_raan * c_u - s_raan * c_inc * s_u)
+    r_bn_n[1] = r_mag * (s_raan * c_u + c_raan * c_inc * s_u)
+    r_bn_n[2] = r_mag * s_inc * s_u
+    v_bn_n[0] = -rat * (c_raan * e_s + s_raan * c_inc * e_c)
+    v_bn_n[1] = -rat * (s_raan * e_s - c_raan * c_inc * e_c)
+    v_bn_n[2] = rat * s_inc * e_c
+    return r_bn_n, v_bn_n
+
+
 def classical_to_vector_elements(
     semi_major_axis: float,
     eccentricity: float = 0.0,
@@ -217,7 +303,8 @@ def classical_to_vector_elements(
     right_ascension: float = 0.0,
     argument_of_periapsis: float = 0.0,
     true_anomaly: float = 0.0,
-    planet: str = "earth"
+    planet: str = "earth",
+    mu: float = None
 ) -> tuple:
     """
     Transforms Keplerian orbital elements into position and velocity in Planet-Centered
@@ -244,32 +331,138 @@ def classical_to_vector_elements(
     :type true_anomaly:             float
     :param planet:                  Name of the central body being orbited (default "earth")
     :type planet:                   str
+    :param mu:                      Optional gravitational parameter of the central body in m^3/s^2. When given,
+                                    the planet is not looked up.
+    :type mu:                       float
 
     :returns:
     :rtype:
     """
 
-    # calculate the semi-latus rectum
-    if eccentricity == 1:
-        # parabolic orbit, the semi-latus rectum can't be calculated from input orbital elements. Therefore, the user
-        #   should use an alternative function
-        raise ValueError("The input orbit is parabolic. The semi-latus rectum can't be calculated, please use different function.")
-    elif eccentricity >= 0:
-        # circular, elliptical or hyperbolic orbit
-        p = semi_major_axis * (1 - eccentricity * eccentricity)
-    else:
-        raise ValueError("The input eccentricity is invalid")
     return semi_latus_rectum_to_vector_elements(
-        semi_latus_rectum=p,
+        semi_latus_rectum=_semi_latus_rectum(semi_major_axis, eccentricity),
         eccentricity=eccentricity,
         inclination=inclination,
         right_ascension=right_ascension,
         argument_of_periapsis=argument_of_periapsis,
         true_anomaly=true_anomaly,
         planet=planet,
+        mu=mu
+    )
+
+
+def classical_to_vector_elements_into(
+    r_out: np.ndarray,
+    v_out: np.ndarray,
+    semi_major_axis: float,
+    eccentricity: float = 0.0,
+    inclination: float = 0.0,
+    right_ascension: float = 0.0,
+    argument_of_periapsis: float = 0.0,
+    true_anomaly: float = 0.0,
+    planet: str = "earth",
+    mu: float = None
+) -> tuple:
+    """
+    Transforms Keplerian orbital elements into position and velocity in Planet-Centered
+    Inertial (PCI) coordinates, writing the state into caller-provided buffers rather
+    than allocating new arrays. This allows propagation loops to reuse the same two
+    buffers for every step of a trajectory. The conversion is otherwise identical to
+    classical_to_vector_elements.
+
+    :param r_out:                   The 3 element float64 buffer to write the position vector into
+    :type r_out:                    numpy.ndarray
+    :param v_out:                   The 3 element float64 buffer to write the velocity vector into
+    :type v_out:                    numpy.ndarray
+    :param semi_major_axis:         Semi-major axis of the orbit in meters
+    :type semi_major_axis:          float
+    :param eccentricity:            Eccentricity of the orbit (default 0.0)
+    :type eccentricity:             float
+    :param inclination:             Inclination of the orbit in radians (default 0.0)
+    :type inclination:              float
+    :param right_ascension:         Right ascension of the ascending node in radians (default 0.0)
+    :type right_ascension:          float
+    :param argument_of_periapsis:   Argument of periapsis in radians (default 0.0)
+    :type argument_of_periapsis:    float
+    :param true_anomaly:            True anomaly at the epoch in radians (default 0.0)
+    :type true_anomaly:             float
+    :param planet:                  Name of the central body being orbited (default "earth")
+    :type planet:                   str
+    :param mu:                      Optional gravitational parameter of the central body in m^3/s^2. When given,
+                                    the planet is not looked up.
+    :type mu:                       float
+
+    :returns:                       The filled position and velocity buffers
+    :rtype:                         tuple
+    """
+
+    if mu is None:
+        mu = get_planet_mu(planet)
+    return _semi_latus_rectum_to_vector_elements(
+        _semi_latus_rectum(semi_major_axis, eccentricity), eccentricity, mu,
+        math.sin(inclination), math.cos(inclination),
+        math.sin(right_ascension), math.cos(right_ascension),
+        math.sin(argument_of_periapsis), math.cos(argument_of_periapsis),
+        math.sin(true_anomaly), math.cos(true_anomaly),
+        r_out, v_out
     )
 
 
+def _semi_latus_rectum(semi_major_axis: float, eccentricity: float) -> float:
+    """
+    Calculates the semi-latus rectum of a non-parabolic orbit from its semi-major
+    axis and eccentricity, raising an error for parabolic or invalid eccentricities.
+    """
+    if eccentricity < 0:
+        raise ValueError("The input eccentricity is invalid")
+    # the factored form of 1 - e^2 keeps its precision close to e = 1
+    one_minus_e2 = (1.0 - eccentricity) * (1.0 + eccentricity)
+    if abs(one_minus_e2) < 1e-12:
+        # parabolic orbit, the semi-latus rectum can't be calculated from input orbital elements. Therefore, the user
+        #   should use an alternative function
+        raise ValueError("The input orbit is parabolic. The semi-latus rectum can't be calculated, please use different function.")
+    # circular, elliptical or hyperbolic orbit
+    return semi_major_axis * one_minus_e2
+
+
+def make_classical_to_vector_elements(planet: str = "earth"):
+    """
+    Creates a version of classical_to_vector_elements specialized to a single
+    planet. The gravitational parameter is looked up once, here, rather than on
+    every call, which suits propagator inner loops that convert many states about
+    the same body. The returned function takes the same orbital elements as
+    classical_to_vector_elements, without the planet argument.
+
+    >>> to_vector = make_classical_to_vector_elements("earth")
+    >>> r_bn_n, v_bn_n = to_vector(7e6, 0.001, 1.0, 0.5, 0.2, 0.0)
+
+    :param planet:  Name of the central body being orbited (default "earth")
+    :type planet:   str
+
+    :returns:       The specialized conversion function, returning a tuple of position and velocity in PCI coordinates
+    :rtype:         callable
+    """
+    mu: float = get_planet_mu(planet)
+
+    def classical_to_vector_elements_planet(
+        semi_major_axis: float,
+        eccentricity: float = 0.0,
+        inclination: float = 0.0,
+        right_ascension: float = 0.0,
+        argument_of_periapsis: float = 0.0,
+        true_anomaly: float = 0.0
+    ) -> tuple:
+        return _semi_latus_rectum_to_vector_elements(
+            _semi_latus_rectum(semi_major_axis, eccentricity), eccentricity, mu,
+            math.sin(inclination), math.cos(inclination),
+            math.sin(right_ascension), math.cos(right_ascension),
+            math.sin(argument_of_periapsis), math.cos(argument_of_periapsis),
+            math.sin(true_anomaly), math.cos(true_anomaly)
+        )
+
+    return classical_to_vector_elements_planet
+
+
 def classical_to_vector_elements_deg(
     semi_major_axis: float,
     eccentricity: float = 0.0,
@@ -277,7 +470,8 @@ def classical_to_vector_elements_deg(
     right_ascension: float = 0.0,
     argument_of_periapsis: float = 0.0,
     true_anomaly: float = 0.0,
-    planet: str = "earth"
+    planet: str = "earth",
+    mu: float = None
 ) -> tuple:
     """
     Transforms Keplerian orbital elements into position and velocity in Planet-Centered
@@ -304,6 +498,9 @@ def classical_to_vector_elements_deg(
     :type true_anomaly:             float
     :param planet:                  Name of the central body being orbited (default "earth")
     :type planet:                   str
+    :param mu:                      Optional gravitational parameter of the central body in m^3/s^2. When given,
+                                    the planet is not looked up.
+    :type mu:                       float
 
     :returns:                       A tuple containing position and velocity vectors in PCI coordinates
     :rtype:                         tuple
@@ -312,12 +509,114 @@ def classical_to_vector_elements_deg(
     return classical_to_vector_elements(
         semi_major_axis=semi_major_axis,
         eccentricity=eccentricity,
-        inclination=np.radians(inclination),
-        right_ascension=np.radians(right_ascension),
-        argument_of_periapsis=np.radians(argument_of_periapsis),
-        true_anomaly=np.radians(true_anomaly),
-        planet=planet
+        inclination=inclination * constants.D2R,
+        right_ascension=right_ascension * constants.D2R,
+        argument_of_periapsis=argument_of_periapsis * constants.D2R,
+        true_anomaly=true_anomaly * constants.D2R,
+        planet=planet,
+        mu=mu
+    )
+
+
+def classical_to_vector_elements_batch(
+    semi_major_axis: np.ndarray,
+    eccentricity: np.ndarray | float = 0.0,
+    inclination: np.ndarray | float = 0.0,
+    right_ascension: np.ndarray | float = 0.0,
+    argument_of_periapsis: np.ndarray | float = 0.0,
+    true_anomaly: np.ndarray | float = 0.0,
+    planet: str = "earth",
+    use_fast_trig: bool = False,
+    r_out: np.ndarray = None,
+    v_out: np.ndarray = None
+) -> tuple:
+    """
+    Transforms arrays of Keplerian orbital elements into position and velocity in Planet-Centered
+    Inertial (PCI) coordinates, converting N orbits in a single vectorized pass.
+
+    The inputs are broadcast against each other, so any element that is shared by all of the orbits
+    may be given as a single float. The conversion is otherwise identical to classical_to_vector_elements.
+    For previews and visualization, the approximate lookup table trigonometry of utils.fast_sin and
+    utils.fast_cos can be used instead, giving states accurate to a few parts in 1e5. The states may
+    be written into existing (N, 3) arrays, such as slices of a larger buffer, to avoid allocating.
+
+    :param semi_major_axis:         Semi-major axes of the orbits in meters
+    :type semi_major_axis:          numpy.ndarray
+    :param eccentricity:            Eccentricities of the orbits (default 0.0)
+    :type eccentricity:             numpy.ndarray or float
+    :param inclination:             Inclinations of the orbits in radians (default 0.0)
+    :type inclination:              numpy.ndarray or float
+    :param right_ascension:         Right ascensions of the ascending nodes in radians (default 0.0)
+    :type right_ascension:          numpy.ndarray or float
+    :param argument_of_periapsis:   Arguments of periapsis in radians (default 0.0)
+    :type argument_of_periapsis:    numpy.ndarray or float
+    :param true_anomaly:            True anomalies at the epoch in radians (default 0.0)
+    :type true_anomaly:             numpy.ndarray or float
+    :param planet:                  Name of the central body being orbited (default "earth")
+    :type planet:                   str
+    :param use_fast_trig:           Whether to use the approximate lookup table sine and cosine (default False)
+    :type use_fast_trig:            bool
+    :param r_out:                   The (N, 3) array to write the positions into (default None allocates a new array)
+    :type r_out:                    numpy.ndarray
+    :param v_out:                   The (N, 3) array to write the velocities into (default None allocates a new array)
+    :type v_out:                    numpy.ndarray
+
+    :returns:                       A tuple containing the (N, 3) position and (N, 3) velocity arrays in PCI coordinates
+    :rtype:                         tuple
+    """
+
+    # broadcast all of the elements to a common (N,) shape
+    a, e, inc, raan, aop, nu = (np.atleast_1d(x) for x in np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (
+            semi_major_axis, eccentricity, inclination, right_ascension, argument_of_periapsis, true_anomaly
+        ))
+    ))
+    # validate the eccentricities in the same manner as the scalar conversion
+    if np.any(e < 0):
+        raise ValueError("The input eccentricity is invalid")
+    one_minus_e2 = (1.0 - e) * (1.0 + e)
+    if np.any(np.fabs(one_minus_e2) < 1e-12):
+        raise ValueError("The input orbit is parabolic. The semi-latus rectum can't be calculated, please use different function.")
+    # calculate the semi-latus rectum
+    p = a * one_minus_e2
+    # calculate the perifocal position and velocity
+    mu: float = get_planet_mu(planet)
+    cos, sin = (fast_cos, fast_sin) if use_fast_trig else (np.cos, np.sin)
+    c_nu = cos(nu)
+    s_nu = sin(nu)
+    r_mag = p / (1 + e * c_nu)
+    rat = np.sqrt(mu / p)
+    r_p = r_mag * c_nu
+    r_q = r_mag * s_nu
+    v_p = -rat * s_nu
+    v_q = rat * (e + c_nu)
+    # calculate the first two columns of the perifocal to pci transformation matrices. The perifocal
+    #   states have no out-of-plane component, so the third column is never needed
+    c_raan = cos(raan)
+    c_aop = cos(aop)
+    c_inc = cos(inc)
+    s_raan = sin(raan)
+    s_aop = sin(aop)
+    s_inc = sin(inc)
+    s_aop_c_inc = s_aop * c_inc
+    c_aop_c_inc = c_aop * c_inc
+    P = (
+        c_aop * c_raan - s_aop_c_inc * s_raan,
+        c_aop * s_raan + s_aop_c_inc * c_raan,
+        s_aop * s_inc,
     )
+    Q = (
+        -s_aop * c_raan - c_aop_c_inc * s_raan,
+        c_aop_c_inc * c_raan - s_aop * s_raan,
+        c_aop * s_inc,
+    )
+    # apply each orbit's transformation to its own perifocal state, one pci component at a time
+    r_bn_n = np.empty((a.shape[0], 3), dtype=np.float64) if r_out is None else r_out
+    v_bn_n = np.empty((a.shape[0], 3), dtype=np.float64) if v_out is None else v_out
+    for k in range(3):
+        r_bn_n[:, k] = P[k] * r_p + Q[k] * r_q
+        v_bn_n[:, k] = P[k] * v_p + Q[k] * v_q
+    return r_bn_n, v_bn_n
 
 
 def vector_to_classical_elements(
@@ -348,29 +647,53 @@ def vector_to_classical_elements(
 
     :raises ArithmeticError:    If the orbit is parabolic, which is not supported by this function.
     """
-    # ensure that the input arrays are of type float
-    r_bn_n = r_bn_n.astype(np.float64)
-    v_bn_n = v_bn_n.astype(np.float64)
+    return _vector_to_classical_elements(r_bn_n, v_bn_n, get_planet_mu(planet))
 
-    # find the gravitational parameter for the planet
-    mu: float = get_planet_mu(planet)
-    # calculate the magnitude of the position and velocity vectors
-    r_mag: float = np.linalg.norm(r_bn_n)
-    v_mag: float = np.linalg.norm(v_bn_n)
 
-    v_mag_sqrd: float = v_mag * v_mag
-    r_mag_dot_v_mag: float = np.dot(r_bn_n, v_bn_n)
+def _vector_to_classical_elements(r_bn_n: np.ndarray, v_bn_n: np.ndarray, mu: float) -> tuple:
+    """
+    Convert state vectors to classical orbital elements about a body with a known gravitational
+    parameter. This is the implementation of `vector_to_classical_elements` once the planet has
+    been resolved, allowing callers that convert several states to only look up the planet once.
+
+    :param r_bn_n:              The position vector in a Cartesian coordinate system in metres.
+    :type r_bn_n:               np.ndarray
+    :param v_bn_n:              The velocity vector in the same Cartesian coordinate system as r_bn_n in metres per second.
+    :type v_bn_n:               np.ndarray
+    :param mu:                  The gravitational parameter of the central body [m^3/s^2]
+    :type mu:                   float
+
+    :returns:                   A tuple of classical orbital elements: semi-major axis, eccentricity, inclination, right ascension of the ascending node (RAAN), argument of periapsis, and true anomaly.
+    :rtype:                     tuple
+
+    :raises ArithmeticError:    If the orbit is parabolic, which is not supported by this function.
+    """
+    # work on the vector components directly; for 3-vectors the scalar arithmetic is far cheaper than the numpy calls
+    rx, ry, rz = float(r_bn_n[0]), float(r_bn_n[1]), float(r_bn_n[2])
+    vx, vy, vz = float(v_bn_n[0]), float(v_bn_n[1]), float(v_bn_n[2])
+
+    # calculate the magnitude of the position and velocity vectors
+    r_mag: float = math.sqrt(rx * rx + ry * ry + rz * rz)
+    v_mag_sqrd: float = vx * vx + vy * vy + vz * vz
+    r_mag_dot_v_mag: float = rx * vx + ry * vy + rz * vz
 
     # angular momentum
-    H: np.ndarray = np.cross(r_bn_n, v_bn_n)
+    hx: float = ry * vz - rz * vy
+    hy: float = rz * vx - rx * vz
+    hz: float = rx * vy - ry * vx
 
-    # the NODE is the cross product of K = [0 0 1] and H. For efficiency, directly assign the cross product result
-    NODE: np.ndarray = np.array([-H[1], H[0], 0])
-    node: float = np.linalg.norm(NODE)
+    # the NODE is the cross product of K = [0 0 1] and H, which is [-H[1], H[0], 0]
+    node_x: float = -hy
+    node_y: float = hx
+    node: float = math.sqrt(node_x * node_x + node_y * node_y)
 
     # the eccentricity vector
-    ECC: np.ndarray = (r_bn_n * (v_mag_sqrd - mu / r_mag) - v_bn_n * r_mag_dot_v_mag) / mu
-    eccentricity: float = np.linalg.norm(ECC)  # eccentricity
+    r_scale: float = (v_mag_sqrd - mu / r_mag) / mu
+    v_scale: float = r_mag_dot_v_mag / mu
+    ecc_x: float = rx * r_scale - vx * v_scale
+    ecc_y: float = ry * r_scale - vy * v_scale
+    ecc_z: float = rz * r_scale - vz * v_scale
+    eccentricity: float = math.sqrt(ecc_x * ecc_x + ecc_y * ecc_y + ecc_z * ecc_z)  # eccentricity
 
     # find the type of orbit and adjust the orbital element set accordingly
     if eccentricity == 1:
@@ -378,16 +701,21 @@ def vector_to_classical_elements(
     # calculate the semi-major axis
     energy: float = v_mag_sqrd / 2 - mu / r_mag
     semi_major_axis: float = -mu / (2 * energy)
-    # calculate the inclination
-    inclination: float = np.arccos(H[2] / np.linalg.norm(H))
-    if np.fabs(node) <= 1e-10:
-        if np.fabs(eccentricity) <= 1e-10:
+    # calculate the inclination, clamping the cosine as rounding can push it just past 1 for equatorial orbits
+    h_mag_sqrd: float = hx * hx + hy * hy + hz * hz
+    h_mag: float = math.sqrt(h_mag_sqrd)
+    inclination: float = math.acos(max(-1.0, min(1.0, hz / h_mag)))
+    # the angles are found with atan2 of their (scaled) sine and cosine, which keeps full precision near 0 and pi and
+    #   resolves the quadrant directly. the sines of the in-plane angles measured from the node use H . (NODE x X),
+    #   which reduces to |H| * X_z for any vector X in the orbital plane
+    if math.fabs(node) <= 1e-10:
+        if math.fabs(eccentricity) <= 1e-10:
             # circular equatorial orbit
             return (
                 semi_major_axis,
                 eccentricity,
                 inclination,
-                utils.acos_quadrant_check(r_bn_n[0], r_mag, r_bn_n[1]),  # true longitude
+                math.atan2(ry, rx) % _TWO_PI,  # true longitude
                 0,
                 0
             )
@@ -398,17 +726,17 @@ def vector_to_classical_elements(
                 eccentricity,
                 inclination,
                 0,
-                utils.acos_quadrant_check(ECC[0], eccentricity, ECC[1]),  # longitude of periapsis
-                utils.acos_quadrant_check(np.dot(ECC, r_bn_n), eccentricity * r_mag, r_mag_dot_v_mag)  # true anomaly
+                math.atan2(ecc_y, ecc_x) % _TWO_PI,  # longitude of periapsis
+                math.atan2(r_mag_dot_v_mag * h_mag, h_mag_sqrd - mu * r_mag) % _TWO_PI  # true anomaly
             )
-    elif np.fabs(eccentricity) <= 1e-10:
+    elif math.fabs(eccentricity) <= 1e-10:
         # circular inclined orbit
         return (
             semi_major_axis,
             eccentricity,
             inclination,
-            utils.acos_quadrant_check(NODE[0], node, NODE[1]),  # RAAN
-            utils.acos_quadrant_check(np.dot(NODE, r_bn_n), node * r_mag, r_bn_n[2]),  # true argument of latitude
+            math.atan2(node_y, node_x) % _TWO_PI,  # RAAN
+            math.atan2(rz * h_mag, node_x * rx + node_y * ry) % _TWO_PI,  # true argument of latitude
             0
         )
     else:
@@ -417,12 +745,145 @@ def vector_to_classical_elements(
             semi_major_axis,
             eccentricity,
             inclination,
-            utils.acos_quadrant_check(NODE[0], node, NODE[1]),  # RAAN
-            utils.acos_quadrant_check(np.dot(NODE, ECC), node * eccentricity, ECC[2]),  # argument of periapsis
-            utils.acos_quadrant_check(np.dot(ECC, r_bn_n), eccentricity * r_mag, r_mag_dot_v_mag)  # true anomaly
+            math.atan2(node_y, node_x) % _TWO_PI,  # RAAN
+            math.atan2(ecc_z * h_mag, node_x * ecc_x + node_y * ecc_y) % _TWO_PI,  # argument of periapsis
+            math.atan2(r_mag_dot_v_mag * h_mag, h_mag_sqrd - mu * r_mag) % _TWO_PI  # true anomaly
         )
 
 
+def vector_to_classical_elements_soa(
+    rx: np.ndarray,
+    ry: np.ndarray,
+    rz: np.ndarray,
+    vx: np.ndarray,
+    vy: np.ndarray,
+    vz: np.ndarray,
+    planet: str = "earth"
+) -> tuple:
+    """
+    Convert N state vectors, given as separate arrays for each component, to arrays of classical
+    orbital elements. Holding the components in their own contiguous arrays lets every step of the
+    conversion run as a single vectorized operation over all of the orbits. The orbit types are
+    handled as in `vector_to_classical_elements`.
+
+    :param rx:                  The x components of the position vectors in metres.
+    :type rx:                   np.ndarray
+    :param ry:                  The y components of the position vectors in metres.
+    :type ry:                   np.ndarray
+    :param rz:                  The z components of the position vectors in metres.
+    :type rz:                   np.ndarray
+    :param vx:                  The x components of the velocity vectors in metres per second.
+    :type vx:                   np.ndarray
+    :param vy:                  The y components of the velocity vectors in metres per second.
+    :type vy:                   np.ndarray
+    :param vz:                  The z components of the velocity vectors in metres per second.
+    :type vz:                   np.ndarray
+    :param planet:              The name of the planet for which the gravitational parameter is needed. Defaults to 'earth'.
+    :type planet:               str
+
+    :returns:                   A tuple of arrays of the classical orbital elements: semi-major axis, eccentricity, inclination, right ascension of the ascending node (RAAN), argument of periapsis, and true anomaly.
+    :rtype:                     tuple
+
+    :raises ArithmeticError:    If any of the orbits is parabolic, which is not supported by this function.
+    """
+    mu: float = get_planet_mu(planet)
+    rx, ry, rz, vx, vy, vz = (np.atleast_1d(x) for x in np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (rx, ry, rz, vx, vy, vz))
+    ))
+
+    # calculate the magnitude of the position and velocity vectors
+    r_mag = np.sqrt(rx * rx + ry * ry + rz * rz)
+    v_mag_sqrd = vx * vx + vy * vy + vz * vz
+    r_mag_dot_v_mag = rx * vx + ry * vy + rz * vz
+
+    # angular momentum
+    hx = ry * vz - rz * vy
+    hy = rz * vx - rx * vz
+    hz = rx * vy - ry * vx
+
+    # the NODE is the cross product of K = [0 0 1] and H, which is [-H[1], H[0], 0]
+    node_x = -hy
+    node_y = hx
+    node = np.sqrt(node_x * node_x + node_y * node_y)
+
+    # the eccentricity vector
+    r_scale = (v_mag_sqrd - mu / r_mag) / mu
+    v_scale = r_mag_dot_v_mag / mu
+    ecc_x = rx * r_scale - vx * v_scale
+    ecc_y = ry * r_scale - vy * v_scale
+    ecc_z = rz * r_scale - vz * v_scale
+    eccentricity = np.sqrt(ecc_x * ecc_x + ecc_y * ecc_y + ecc_z * ecc_z)
+
+    if np.any(eccentricity == 1):
+        raise ArithmeticError("An orbit is parabolic. Consider using a different function.")
+    # calculate the semi-major axis
+    energy = v_mag_sqrd / 2 - mu / r_mag
+    semi_major_axis = -mu / (2 * energy)
+    # calculate the inclination
+    h_mag_sqrd = hx * hx + hy * hy + hz * hz
+    h_mag = np.sqrt(h_mag_sqrd)
+    inclination = np.arccos(np.clip(hz / h_mag, -1.0, 1.0))
+
+    # evaluate the angles of every orbit type for every orbit, then select the set matching each orbit's type. the
+    #   angles use the same atan2 forms as the scalar conversion, so no candidate divides by a zero node or
+    #   eccentricity
+    equatorial = np.fabs(node) <= 1e-10
+    circular = np.fabs(eccentricity) <= 1e-10
+    conditions = [equatorial & circular, equatorial, circular]
+    true_longitude = np.arctan2(ry, rx) % _TWO_PI
+    longitude_of_periapsis = np.arctan2(ecc_y, ecc_x) % _TWO_PI
+    anomaly = np.arctan2(r_mag_dot_v_mag * h_mag, h_mag_sqrd - mu * r_mag) % _TWO_PI
+    node_angle = np.arctan2(node_y, node_x) % _TWO_PI
+    argument_of_latitude = np.arctan2(rz * h_mag, node_x * rx + node_y * ry) % _TWO_PI
+    periapsis_angle = np.arctan2(ecc_z * h_mag, node_x * ecc_x + node_y * ecc_y) % _TWO_PI
+    # circular equatorial, equatorial elliptical, circular inclined and classical elliptical inclined orbits in turn
+    right_ascension = np.select(conditions, [true_longitude, 0.0, node_angle], node_angle)
+    argument_of_periapsis = np.select(
+        conditions, [0.0, longitude_of_periapsis, argument_of_latitude], periapsis_angle
+    )
+    true_anomaly = np.select(conditions, [0.0, anomaly, 0.0], anomaly)
+
+    return semi_major_axis, eccentricity, inclination, right_ascension, argument_of_periapsis, true_anomaly
+
+
+def vector_to_classical_elements_batch(
+    r_bn_n: np.ndarray,
+    v_bn_n: np.ndarray,
+    planet: str = "earth"
+) -> tuple:
+    """
+    Convert N state vectors to arrays of classical orbital elements. This unpacks the (N, 3)
+    position and velocity arrays into their components and converts them with
+    `vector_to_classical_elements_soa`.
+
+    :param r_bn_n:              The (N, 3) position vectors in a Cartesian coordinate system in metres.
+    :type r_bn_n:               np.ndarray
+    :param v_bn_n:              The (N, 3) velocity vectors in the same Cartesian coordinate system as r_bn_n in metres per second.
+    :type v_bn_n:               np.ndarray
+    :param planet:              The name of the planet for which the gravitational parameter is needed. Defaults to 'earth'.
+    :type planet:               str
+
+    :returns:                   A tuple of arrays of the classical orbital elements: semi-major axis, eccentricity, inclination, right ascension of the ascending node (RAAN), argument of periapsis, and true anomaly.
+    :rtype:                     tuple
+
+    :raises ArithmeticError:    If any of the orbits is parabolic, which is not supported by this function.
+    """
+    return vector_to_classical_elements_soa(*_unpack_soa(r_bn_n), *_unpack_soa(v_bn_n), planet=planet)
+
+
+def _unpack_soa(states: np.ndarray) -> tuple:
+    """
+    Splits an array of N row vectors into a tuple of views of each of its component columns.
+
+    :param states:  The (N, M) array of vectors
+    :type states:   np.ndarray
+    :return:        The M component arrays, each of shape (N,)
+    :rtype:         tuple
+    """
+    states = np.asarray(states, dtype=np.float64)
+    return tuple(states[:, k] for k in range(states.shape[1]))
+
+
 def pcpf_to_geodetic_lla (position: np.ndarray, planet="Earth") -> np.ndarray:
     """
     Converts the Planet-Centred, Planet-Fixed parameters to Latitude, 
@@ -436,25 +897,24 @@ def pcpf_to_geodetic_lla (position: np.ndarray, planet="Earth") -> np.ndarray:
     :return:            Tuple containing Latitude [rad], Longitude [rad], and Altitude [m]
     :rtype:             np.ndarray
     """
-    # ensure that the input array is of type float
-    position = position.astype(np.float64)
-    # handle the edge case where the position is zero
-    if np.linalg.norm(position) == 0:
+    # ensure that the input array is of type float, which also accepts lists, and unpack its components
+    position = np.asarray(position, dtype=np.float64)
+    x, y, z = float(position[0]), float(position[1]), float(position[2])
+    # handle the edge case where the position is zero, without forming the norm
+    if x == 0 and y == 0 and z == 0:
         return np.array([0, 0, 0], dtype=np.float64)
-    # make sure that the position is of type float
-    position = position.astype(dtype=np.float64)
     # WGS Parameters
     a: float = get_planet_property(planet=planet, property="REQ")  # Equatorial radius of the planet
     f: float = get_planet_property(planet=planet, property="FLATTENING")  # Flattening factor of the planet
-    e: float = np.sqrt(2 * f - f ** 2)
+    e: float = math.sqrt(2 * f - f ** 2)
 
-    longitude: float = np.arctan2(position[1], position[0])
-    P: float = np.sqrt(position[0] ** 2 + position[1] ** 2)
+    longitude: float = math.atan2(y, x)
+    P: float = math.sqrt(x * x + y * y)
 
     # Initial calculations for latitude and altitude
     altitude: float = 0
-    latitude: float = np.arctan2(position[2], P * (1 - e ** 2))
-    N: float = a / np.sqrt(1 - (e * np.sin(latitude)) ** 2)
+    latitude: float = math.atan2(z, P * (1 - e ** 2))
+    N: float = a / math.sqrt(1 - (e * math.sin(latitude)) ** 2)
     delta_h: float = 1000000
     prevH: float = 0
     iterations: int = 0
@@ -462,16 +922,17 @@ def pcpf_to_geodetic_lla (position: np.ndarray, planet="Earth") -> np.ndarray:
     # Iterative calculations for latitude and altitude
     while delta_h > 0.01 and iterations < 10:
         prevH = altitude
-        latitude = np.arctan2(position[2], P * (1 - e ** 2 * (N / (N + altitude))))
-        if np.isnan(latitude):
+        latitude = math.atan2(z, P * (1 - e ** 2 * (N / (N + altitude))))
+        if math.isnan(latitude):
             raise ValueError("Latitude is NaN")
-        N = a / np.sqrt(1 - (e * np.sin(latitude)) ** 2)
+        N = a / math.sqrt(1 - (e * math.sin(latitude)) ** 2)
         # handle the case when the cos(latitude) is zero (within floating point error) to avoid a divide by zero error
-        if np.cos(latitude) < 1e-10:
-            altitude = np.fabs(position[2]) - a * (1 - f)
+        cos_latitude = math.cos(latitude)
+        if cos_latitude < 1e-10:
+            altitude = math.fabs(z) - a * (1 - f)
         else:
-            altitude = P / np.cos(latitude) - N
-        delta_h = np.abs(altitude - prevH)
+            altitude = P / cos_latitude - N
+        delta_h = abs(altitude - prevH)
         iterations += 1
 
     return np.array([latitude, longitude, altitude], dtype=np.float64)
@@ -491,7 +952,7 @@ def pcpf_to_geodetic_lla_deg (position: np.ndarray, planet="Earth") -> np.ndarra
     :rtype:             np.ndarray
     """
     lla = pcpf_to_geodetic_lla(position, planet=planet)
-    return np.array([np.degrees(lla[0]), np.degrees(lla[1]), lla[2]], dtype=np.float64)
+    return np.array([lla[0] * constants.R2D, lla[1] * constants.R2D, lla[2]], dtype=np.float64)
 
 
 def geodetic_lla_to_pcpf (lla: np.ndarray, planet="Earth") -> np.ndarray:
@@ -543,8 +1004,8 @@ def geodetic_lla_to_pcpf_deg(lla: np.ndarray, planet="Earth") -> np.ndarray:
     """
 
     # Convert latitude and longitude from degrees to radians
-    lat: float = np.radians(lla[0])  # Latitude in radians
-    lon: float = np.radians(lla[1])  # Longitude in radians
+    lat: float = lla[0] * constants.D2R  # Latitude in radians
+    lon: float = lla[1] * constants.D2R  # Longitude in radians
     return geodetic_lla_to_pcpf(np.array([lat, lon, lla[2]], dtype=np.float64), planet=planet)
 
 
@@ -664,7 +1125,7 @@ def enu_to_azimuth_elevation(enu_vectors: np.ndarray) -> Tuple[np.ndarray, np.nd
         enu_vectors = enu_vectors[np.newaxis, :]
     # Calculate azimuth angle
     azimuth = np.arctan2(enu_vectors[:, 0], enu_vectors[:, 1])
-    azimuth = normalize_angle(azimuth, angle_max=2 * np.pi)
+    azimuth = normalize_angle(azimuth, angle_max=_TWO_PI)
     # Handle devision by zero
     norm = np.linalg.norm(enu_vectors, axis=1)
     if np.any(norm == 0):
@@ -758,6 +1219,43 @@ def calculate_circular_orbit_velocity(semi_major_axis: float, gm=constants.EARTH
     return calculate_orbital_velocity(r_bn_n_mag=semi_major_axis, semi_major_axis=semi_major_axis, gm=gm)
 
 
+def _kepler(mean_anomaly: float, eccentricity: float, tolerance: float = 1e-12, max_iterations: int = 8) -> float:
+    """
+    Solves Kepler's equation for the Eccentric Anomaly using Halley's method with Danby's
+    starting guess. The iteration budget is fixed, which is sufficient to converge to the
+    tolerance for all elliptical orbits (0 <= e < 1).
+
+    :param mean_anomaly:    [rad] The Mean Anomaly
+    :type mean_anomaly:     float
+    :param eccentricity:    [-] The eccentricity of the orbit (0 <= e < 1)
+    :type eccentricity:     float
+    :param tolerance:       [rad] The correction below which the solution is considered converged
+    :type tolerance:        float
+    :param max_iterations:  [-] The maximum number of Halley iterations to perform
+    :type max_iterations:   int
+
+    :return:                [rad] The Eccentric Anomaly of the Mean Anomaly reduced to [0, 2*pi) (not normalized)
+    :rtype:                 float
+    """
+    # Danby's starting guess for the eccentric anomaly, from the Mean Anomaly reduced to [0, 2pi). where sin(M) is
+    #   within the tolerance of zero, M is itself all but the root, and starting off to one side would converge onto a
+    #   tiny negative anomaly that normalizes to 2*pi
+    mean_anomaly %= _TWO_PI
+    sin_m = math.sin(mean_anomaly)
+    eccentric_anomaly = mean_anomaly + 0.85 * eccentricity * math.copysign(1.0, sin_m) \
+        if math.fabs(sin_m) >= tolerance else mean_anomaly
+    for _ in range(max_iterations):
+        e_sin = eccentricity * math.sin(eccentric_anomaly)
+        f_prime = 1.0 - eccentricity * math.cos(eccentric_anomaly)
+        f = eccentric_anomaly - e_sin - mean_anomaly
+        # Halley's correction, using f'' = e * sin(E)
+        delta = f / (f_prime - 0.5 * f * e_sin / f_prime)
+        eccentric_anomaly -= delta
+        if math.fabs(delta) < tolerance:
+            break
+    return eccentric_anomaly
+
+
 def mean_to_eccentric_anomaly(mean_anomaly: float, eccentricity: float) -> float:
     """
     Converts the Mean Anomaly to the Eccentric Anomaly.
@@ -774,16 +1272,9 @@ def mean_to_eccentric_anomaly(mean_anomaly: float, eccentricity: float) -> float
     mean_anomaly = utils.normalize_angle(mean_anomaly)
     if eccentricity == 0:
         # if the eccentricity is zero, then the eccentric anomaly is equal to the mean anomaly
-        # return this to avoid a singularity in ratio
         return mean_anomaly
-    # define the initial guess for the eccentric anomaly
-    eccentric_anomaly = mean_anomaly + eccentricity / 2 if mean_anomaly < np.pi else mean_anomaly - eccentricity / 2
     # calculate the eccentric anomaly
-    ratio = 1.0
-    while np.fabs(ratio) > 1e-10 / 100.0:
-        ratio = (eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly) - mean_anomaly) / (1 - eccentricity * np.cos(eccentric_anomaly))
-        eccentric_anomaly = eccentric_anomaly - ratio
-    return utils.normalize_angle(eccentric_anomaly)
+    return utils.normalize_angle(_kepler(mean_anomaly, eccentricity))
 
 
 def eccentric_to_true_anomaly(eccentric_anomaly: float, eccentricity: float) -> float:
@@ -800,12 +1291,12 @@ def eccentric_to_true_anomaly(eccentric_anomaly: float, eccentricity: float) ->
     """
     # ensure that the input parameters are within physically meaningful ranges
     eccentric_anomaly = utils.normalize_angle(eccentric_anomaly)
-    # for EA > pi, TA will pi < TA < EA. But we need to take the corresponding angle
-    test = -1 if eccentric_anomaly > np.pi else 1
-    return utils.acos_quadrant_check(
-        np.cos(eccentric_anomaly) - eccentricity,
-        1 - eccentricity * np.cos(eccentric_anomaly),
-        test
+    # half-angle form, tan(f/2) = sqrt((1+e)/(1-e)) tan(E/2). with EA/2 in [0, pi) the sine term is non-negative, so
+    #   atan2 lands in [0, pi] and the result is already in [0, 2pi) without a quadrant check
+    half = 0.5 * eccentric_anomaly
+    return 2.0 * np.arctan2(
+        np.sqrt(1.0 + eccentricity) * np.sin(half),
+        np.sqrt(1.0 - eccentricity) * np.cos(half)
     )
 
 
@@ -819,11 +1310,12 @@ def true_to_eccentric_anomaly(true_anomaly: float, eccentricity: float) -> float
     :return:             [rad] Eccentric anomaly
     :rtype:              float
     """
-    return utils.normalize_angle(
-        np.arctan2(
-            np.sin(true_anomaly) * np.sqrt(1 - eccentricity**2),
-            eccentricity + np.cos(true_anomaly)
-        )
+    # half-angle form, tan(E/2) = sqrt((1-e)/(1+e)) tan(f/2), which avoids forming sqrt(1 - e^2) for eccentric
+    #   orbits. normalizing the input keeps the result in [0, 2pi) without wrapping the output
+    half = 0.5 * utils.normalize_angle(true_anomaly)
+    return 2.0 * np.arctan2(
+        np.sqrt(1.0 - eccentricity) * np.sin(half),
+        np.sqrt(1.0 + eccentricity) * np.cos(half)
     )
 
 
@@ -866,8 +1358,9 @@ def mean_to_true_anomaly(mean_anomaly: float, eccentricity: float) -> float:
     :return:                [rad] The true anomaly of the orbit
     :rtype:                 float
     """
+    # the eccentric to true anomaly conversion normalizes the angle, so the raw Kepler solution can be passed through
     return eccentric_to_true_anomaly(
-        mean_to_eccentric_anomaly(
+        _kepler(
             mean_anomaly,
             eccentricity
         ),
@@ -875,6 +1368,119 @@ def mean_to_true_anomaly(mean_anomaly: float, eccentricity: float) -> float:
     )
 
 
+def _kepler_array(
+    mean_anomaly: np.ndarray,
+    eccentricity: np.ndarray,
+    tolerance: float = 1e-12,
+    max_iterations: int = 8
+) -> np.ndarray:
+    """
+    Solves Kepler's equation for arrays of Mean Anomalies, iterating Halley's method on
+    every element until all of them have converged. See _kepler for the scalar version.
+
+    :param mean_anomaly:    [rad] The Mean Anomalies
+    :type mean_anomaly:     numpy.ndarray
+    :param eccentricity:    [-] The eccentricities of the orbits (0 <= e < 1)
+    :type eccentricity:     numpy.ndarray
+    :param tolerance:       [rad] The correction below which the solutions are considered converged
+    :type tolerance:        float
+    :param max_iterations:  [-] The maximum number of Halley iterations to perform
+    :type max_iterations:   int
+
+    :return:                [rad] The Eccentric Anomalies of the Mean Anomalies reduced to [0, 2*pi) (not normalized)
+    :rtype:                 numpy.ndarray
+    """
+    # Danby's starting guess for the eccentric anomaly, from the Mean Anomaly reduced to [0, 2pi). as in _kepler, M
+    #   itself is the starting guess where sin(M) is within the tolerance of zero
+    mean_anomaly = np.remainder(mean_anomaly, _TWO_PI)
+    sin_m = np.sin(mean_anomaly)
+    eccentric_anomaly = np.where(
+        np.fabs(sin_m) < tolerance,
+        mean_anomaly,
+        mean_anomaly + 0.85 * eccentricity * np.copysign(1.0, sin_m)
+    )
+    for _ in range(max_iterations):
+        e_sin = eccentricity * np.sin(eccentric_anomaly)
+        f_prime = 1.0 - eccentricity * np.cos(eccentric_anomaly)
+        f = eccentric_anomaly - e_sin - mean_anomaly
+        # Halley's correction, using f'' = e * sin(E)
+        delta = f / (f_prime - 0.5 * f * e_sin / f_prime)
+        eccentric_anomaly = eccentric_anomaly - delta
+        if np.all(np.fabs(delta) < tolerance):
+            break
+    return eccentric_anomaly
+
+
+def _true_to_mean_anomaly_array(true_anomaly: np.ndarray, eccentricity: np.ndarray) -> np.ndarray:
+    """
+    Array form of true_to_mean_anomaly, using the same half-angle conversion.
+    """
+    half = 0.5 * np.remainder(true_anomaly, _TWO_PI)
+    eccentric_anomaly = 2.0 * np.arctan2(
+        np.sqrt(1.0 - eccentricity) * np.sin(half),
+        np.sqrt(1.0 + eccentricity) * np.cos(half)
+    )
+    return np.remainder(eccentric_anomaly - eccentricity * np.sin(eccentric_anomaly), _TWO_PI)
+
+
+def _mean_to_true_anomaly_array(mean_anomaly: np.ndarray, eccentricity: np.ndarray) -> np.ndarray:
+    """
+    Array form of mean_to_true_anomaly, using the same half-angle conversion.
+    """
+    half = 0.5 * np.remainder(_kepler_array(mean_anomaly, eccentricity), _TWO_PI)
+    return 2.0 * np.arctan2(
+        np.sqrt(1.0 + eccentricity) * np.sin(half),
+        np.sqrt(1.0 - eccentricity) * np.cos(half)
+    )
+
+
+def _sqrt(x: float) -> float:
+    """
+    The square root of a float, which is nan for a negative value as with numpy rather than
+    raising, so that hyperbolic orbits map to nan elements.
+    """
+    return math.sqrt(x) if x >= 0.0 else math.nan
+
+
+def _cot(cos_x: float, sin_x: float) -> float:
+    """
+    The cotangent from a cached cosine and sine, which is nan where the sine is zero.
+    """
+    return cos_x / sin_x if sin_x != 0.0 else math.nan
+
+
+def _cot_array(cos_x: np.ndarray, sin_x: np.ndarray) -> np.ndarray:
+    """
+    Array form of _cot, which is nan where the sine is zero.
+    """
+    return np.divide(cos_x, sin_x, out=np.full_like(cos_x, np.nan), where=sin_x != 0.0)
+
+
+# the elementary functions used by the shared element mappings, for scalar floats and for numpy arrays respectively
+_SCALAR_MATH = SimpleNamespace(
+    sqrt=_sqrt,
+    sin=math.sin,
+    cos=math.cos,
+    atan2=math.atan2,
+    asin=math.asin,
+    minimum=min,
+    true_to_mean_anomaly=true_to_mean_anomaly,
+    mean_to_true_anomaly=mean_to_true_anomaly,
+    cot=_cot,
+)
+_ARRAY_MATH = SimpleNamespace(
+    sqrt=np.sqrt,
+    sin=np.sin,
+    cos=np.cos,
+    atan2=np.arctan2,
+    asin=np.arcsin,
+    minimum=np.minimum,
+    true_to_mean_anomaly=_true_to_mean_anomaly_array,
+    mean_to_true_anomaly=_mean_to_true_anomaly_array,
+    cot=_cot_array,
+)
+
+
 def mean_to_osculating_elements(
     req: float,
     j2: float,
@@ -920,8 +1526,79 @@ def mean_to_osculating_elements(
                                     )
     :rtype:                     tuple
     """
+    return _mean_to_osculating_elements(
+        req, j2, semi_major_axis, eccentricity, inclination, right_ascension, argument_of_periapsis, true_anomaly,
+        mean_to_osculating, _SCALAR_MATH
+    )
+
+
+def mean_to_osculating_elements_batch(
+    req: float,
+    j2: float,
+    semi_major_axis: np.ndarray | float,
+    eccentricity: np.ndarray | float,
+    inclination: np.ndarray | float,
+    right_ascension: np.ndarray | float,
+    argument_of_periapsis: np.ndarray | float,
+    true_anomaly: np.ndarray | float,
+    mean_to_osculating: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    First-order J2 Mapping Between Mean and Osculating Orbital Elements for arrays of
+    orbits, converting N orbits in a single vectorized pass. The inputs are broadcast
+    against each other, so any element that is shared by all of the orbits may be given
+    as a single float. The mapping is otherwise identical to mean_to_osculating_elements.
+
+    :param req:                 [m] Equatorial radius or the orbital body
+    :type req:                  float
+    :param j2:                  [-] J2 parameter for the orbital body of interest
+    :type j2:                   float
+    :param semi_major_axis:     [m] Semi-major axes of the orbits
+    :type semi_major_axis:      numpy.ndarray or float
+    :param eccentricity:        [-] Eccentricities of the orbits
+    :type eccentricity:         numpy.ndarray or float
+    :param inclination:         [rad] Inclinations of the orbits
+    :type inclination:          numpy.ndarray or float
+    :param right_ascension:     [rad] Right ascensions of the ascending nodes of the orbits
+    :type right_ascension:      numpy.ndarray or float
+    :param argument_of_periapsis:   [rad] Arguments of periapsis of the orbits
+    :type argument_of_periapsis:    numpy.ndarray or float
+    :param true_anomaly:        [rad] True anomalies of the orbits
+    :type true_anomaly:         numpy.ndarray or float
+    :param mean_to_osculating:  [-] Sgn=True:mean to osc, Sgn=False:osc to mean
+    :type mean_to_osculating:   bool
+    :return:                    [-] A tuple of the (N,) arrays of each classical element, in the same order as
+                                    mean_to_osculating_elements
+    :rtype:                     tuple
+    """
+    # broadcast all of the elements to a common (N,) shape
+    a, e, i, Omega, omega, f = (np.atleast_1d(x) for x in np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (
+            semi_major_axis, eccentricity, inclination, right_ascension, argument_of_periapsis, true_anomaly
+        ))
+    ))
+    return _mean_to_osculating_elements(req, j2, a, e, i, Omega, omega, f, mean_to_osculating, _ARRAY_MATH)
+
+
+def _mean_to_osculating_elements(
+    req: float,
+    j2: float,
+    semi_major_axis,
+    eccentricity,
+    inclination,
+    right_ascension,
+    argument_of_periapsis,
+    true_anomaly,
+    mean_to_osculating: bool,
+    xp: SimpleNamespace
+) -> tuple:
+    """
+    The arithmetic of the first-order J2 mapping, shared by the scalar and the batch
+    conversions. The elementary functions are taken from the given namespace, which is
+    either the math module functions for floats or the numpy functions for arrays.
+    """
     # ensure that the J2 parameter is positive
-    j2 = np.abs(j2)
+    j2 = abs(j2)
     # define the sign of the gamma2 parameter to dictate conversion from mean to osculating or vice versa
     sgn = 1 if mean_to_osculating else -1
     # unpack the orbital elements
@@ -932,86 +1609,100 @@ def mean_to_osculating_elements(
     omega = argument_of_periapsis
     f = true_anomaly
     # calculate the mean anomaly
-    E = true_to_eccentric_anomaly(f, e)
-    M = eccentric_to_mean_anomaly(E, e)
+    M = xp.true_to_mean_anomaly(f, e)
     # calculate the gamma2 parameter
     gamma2 = sgn * j2 / 2 * (req / a) ** 2
-    eta = np.sqrt(1 - e ** 2)
+    eta = xp.sqrt(1 - e ** 2)
     eta2 = eta ** 2
     eta3 = eta ** 3
     eta4 = eta ** 4
     eta6 = eta ** 6
     gamma2p = gamma2 / eta4
-    a_r = (1 + e * np.cos(f)) / eta2
-    cos_i = np.cos(i)
+    # evaluate each distinct trigonometric term once; the series below reuses them many times over
+    cos_f = xp.cos(f)
+    sin_f = xp.sin(f)
+    cos_2w = xp.cos(2 * omega)
+    sin_2w = xp.sin(2 * omega)
+    cos_2wf = xp.cos(2 * omega + f)
+    sin_2wf = xp.sin(2 * omega + f)
+    cos_2w2f = xp.cos(2 * omega + 2 * f)
+    sin_2w2f = xp.sin(2 * omega + 2 * f)
+    cos_2w3f = xp.cos(2 * omega + 3 * f)
+    sin_2w3f = xp.sin(2 * omega + 3 * f)
+    a_r = (1 + e * cos_f) / eta2
+    cos_i = xp.cos(i)
     cos_i2 = cos_i ** 2
     cos_i4 = cos_i ** 4
     cos_i6 = cos_i ** 6
-    cos_f = np.cos(f)
+    # sin(i) is evaluated directly rather than recovered from the cached cosine, which would round to exactly zero
+    #   for retrograde equatorial orbits (i = pi). the 1/tan(i) term in the inclination correction is undefined for
+    #   prograde equatorial orbits (i = 0), where it is nan
+    sin_i = xp.sin(i)
+    cot_i = xp.cot(cos_i, sin_i)
+    # the terms below recur throughout the series, so they are evaluated once
+    e2 = e * e
+    k5 = 1 - 5 * cos_i2
+    k_long = 1 - 11 * cos_i2 - 40 * cos_i4 / k5
+    f_m = f - M + e * sin_f
+    s_series = 3 * sin_2w2f + 3 * e * sin_2wf + e * sin_2w3f
+    cos_f_series = 3 * cos_f + 3 * e * cos_f ** 2 + e2 * cos_f ** 3
+    a_r3 = a_r ** 3
     # calculate the osculating semi-major axis
     ap = a + a * gamma2 * (
-        (3 * cos_i2 - 1) * (a_r ** 3 - 1 / eta3) +
-        3 * (1 - cos_i2) * (a_r ** 3) * np.cos(2 * omega + 2 * f)
+        (3 * cos_i2 - 1) * (a_r3 - 1 / eta3) +
+        3 * (1 - cos_i2) * a_r3 * cos_2w2f
     )
     # calculate the osculating eccentricity
-    de1 = gamma2p / 8 * e * eta2 * (
-        1 - 11 * cos_i2 - 40 * cos_i2 ** 2 / (1 - 5 * cos_i2)
-    ) * np.cos(2 * omega)
+    de1 = gamma2p / 8 * e * eta2 * k_long * cos_2w
     de = de1 + eta2 / 2 * (
-        gamma2 * ((3 * cos_i2 - 1) / eta6
-                  * (e * eta + e / (1 + eta) + 3 * cos_f + 3 * e * cos_f ** 2 + e ** 2
-                     * cos_f ** 3) + 3 * (1 - cos_i2) / eta6
-                  * (e + 3 * cos_f + 3 * e * cos_f ** 2 + e ** 2 * cos_f ** 3) *
-                  np.cos(2 * omega + 2 * f))
+        gamma2 * ((3 * cos_i2 - 1) / eta6 * (e * eta + e / (1 + eta) + cos_f_series) +
+                  3 * (1 - cos_i2) / eta6 * (e + cos_f_series) * cos_2w2f)
         - gamma2p * (1 - cos_i2) *
-        (3 * np.cos(2 * omega + f) + np.cos(2 * omega + 3 * f))
+        (3 * cos_2wf + cos_2w3f)
     )
     # calculate the osculating inclination
-    di = -e * de1 / eta2 / np.tan(i) + gamma2p / 2 * cos_i * np.sqrt(1 - cos_i2) * (
-        3 * np.cos(2 * omega + 2 * f) + 3 * e * np.cos(2 * omega + f) +
-        e * np.cos(2 * omega + 3 * f))
-    # calculate the osculating mean anomaly
-    m_pop_op = M + omega + Omega + gamma2p / 8.0 * eta3 * (1 - 11 * cos_i2
-                                                           - 40 * cos_i4 / (1 - 5 * cos_i2)) * np.sin(2 * omega) \
-              - gamma2p / 16.0 * (2 + e ** 2 - 11 * (2 + 3 * e ** 2) * cos_i2 - 40 * (2 + 5 * e ** 2)
-                                  * cos_i4 / (1 - 5 * cos_i2) - 400 * e ** 2 * cos_i6
-                                  / ((1 - 5 * cos_i2) * (1 - 5 * cos_i2))) * np.sin(2 * omega) \
-              + gamma2p / 4.0 * (-6 * (1 - 5 * cos_i2) * (f - M + e * np.sin(f)) + (3 - 5 * cos_i2)
-                                 * (3 * np.sin(2 * omega + 2 * f) + 3 * e * np.sin(2 * omega + f) + e * np.sin(2 * omega + 3 * f))) \
-              - gamma2p / 8 * e ** 2 * cos_i * (11 + 80 * cos_i2 / (1 - 5 * cos_i2)
-                                                + 200 * cos_i4 / ((1 - 5 * cos_i2) * (1 - 5 * cos_i2))) * np.sin(2 * omega) \
-              - gamma2p / 2.0 * cos_i * (6 * (f - M + e * np.sin(f)) - 3 * np.sin(2 * omega + 2 * f)
-                                         - 3 * e * np.sin(2 * omega + f) - e * np.sin(2 * omega + 3 * f))
-    # calculate the osculating eccentricity mean anomaly
-    ed_m = gamma2p / 8.0 * e * eta3 * (1 - 11 * cos_i2 - 40 * cos_i4
-                                        / (1 - 5 * cos_i2)) * np.sin(2 * omega) \
-           - gamma2p / 4.0 * eta3 * (2 * (3 * cos_i2 - 1)
-                                     * ((a_r * eta) * (a_r * eta) + a_r + 1) * np.sin(f) +
-                                     3 * (1 - cos_i2) * ((-(a_r * eta) * (a_r * eta) - a_r + 1)
-                                                         * np.sin(2 * omega + f) + ((a_r * eta) * (a_r * eta) + a_r + 1 / 3.0) * np.sin(2 * omega + 3 * f)))
+    di = -e * de1 / eta2 * cot_i + gamma2p / 2 * cos_i * sin_i * (
+        3 * cos_2w2f + 3 * e * cos_2wf +
+        e * cos_2w3f)
     # calculate the osculating right ascension of the ascending node
-    d_omega = -gamma2p / 8.0 * e ** 2 * cos_i * (11 + 80 * cos_i2 / (1 - 5 * cos_i2)
-                                                 + 200 * cos_i4 / ((1 - 5 * cos_i2) * (1 - 5 * cos_i2))) * np.sin(2 * omega) \
-              - gamma2p / 2.0 * cos_i * (6 * (f - M + e * np.sin(f)) - 3 * np.sin(2 * omega + 2 * f)
-                                         - 3 * e * np.sin(2 * omega + f) - e * np.sin(2 * omega + 3 * f))
+    d_omega = -gamma2p / 8.0 * e2 * cos_i * (11 + 80 * cos_i2 / k5 + 200 * cos_i4 / (k5 * k5)) * sin_2w \
+              - gamma2p / 2.0 * cos_i * (6 * f_m - s_series)
+    # calculate the osculating mean anomaly, whose final terms are the right ascension correction
+    sin_2w_term = gamma2p / 8.0 * eta3 * k_long * sin_2w
+    m_pop_op = M + omega + Omega + sin_2w_term \
+              - gamma2p / 16.0 * (2 + e2 - 11 * (2 + 3 * e2) * cos_i2 - 40 * (2 + 5 * e2) * cos_i4 / k5
+                                  - 400 * e2 * cos_i6 / (k5 * k5)) * sin_2w \
+              + gamma2p / 4.0 * (-6 * k5 * f_m + (3 - 5 * cos_i2) * s_series) \
+              + d_omega
+    # calculate the osculating eccentricity mean anomaly
+    a_r_eta2 = (a_r * eta) * (a_r * eta)
+    ed_m = e * sin_2w_term \
+           - gamma2p / 4.0 * eta3 * (2 * (3 * cos_i2 - 1) * (a_r_eta2 + a_r + 1) * sin_f +
+                                     3 * (1 - cos_i2) * ((-a_r_eta2 - a_r + 1) * sin_2wf +
+                                                         (a_r_eta2 + a_r + 1 / 3.0) * sin_2w3f))
     # calculate the osculating mean anomaly
-    d1 = (e + de) * np.sin(M) + ed_m * np.cos(M)
-    d2 = (e + de) * np.cos(M) - ed_m * np.sin(M)
-    m_p = np.arctan2(d1, d2)
-    e_p = np.sqrt(d1 ** 2 + d2 ** 2)
+    sin_M = xp.sin(M)
+    cos_M = xp.cos(M)
+    d1 = (e + de) * sin_M + ed_m * cos_M
+    d2 = (e + de) * cos_M - ed_m * sin_M
+    m_p = xp.atan2(d1, d2)
+    e_p = xp.sqrt(d1 ** 2 + d2 ** 2)
     # calculate the osculating right ascension of the ascending node
-    d3 = (np.sin(i / 2.0) + np.cos(i / 2.0) * di / 2.0) * np.sin(Omega) + \
-         np.sin(i / 2.0) * d_omega * np.cos(Omega)
-    d4 = (np.sin(i / 2.0) + np.cos(i / 2.0) * di / 2.0) * np.cos(Omega) - \
-            np.sin(i / 2.0) * d_omega * np.sin(Omega)
-    Omega_p = np.arctan2(d3, d4)
-    d_34 = np.sqrt(d3 ** 2 + d4 ** 2)
-    d_34 = -1 if d_34 < -1 else d_34
-    d_34 = 1 if d_34 > 1 else d_34
-    i_p = 2 * np.arcsin(d_34)
+    sin_hi = xp.sin(i / 2.0)
+    cos_hi = xp.cos(i / 2.0)
+    sin_Omega = xp.sin(Omega)
+    cos_Omega = xp.cos(Omega)
+    d3 = (sin_hi + cos_hi * di / 2.0) * sin_Omega + \
+         sin_hi * d_omega * cos_Omega
+    d4 = (sin_hi + cos_hi * di / 2.0) * cos_Omega - \
+            sin_hi * d_omega * sin_Omega
+    Omega_p = xp.atan2(d3, d4)
+    d_34 = xp.sqrt(d3 ** 2 + d4 ** 2)
+    # the magnitude is non-negative, so only the upper bound of the arcsine domain needs clamping
+    d_34 = xp.minimum(d_34, 1.0)
+    i_p = 2 * xp.asin(d_34)
     omega_p = m_pop_op - m_p - Omega_p
-    E_p = mean_to_eccentric_anomaly(m_p, e_p)
-    f_p = eccentric_to_true_anomaly(E_p, e_p)
+    f_p = xp.mean_to_true_anomaly(m_p, e_p)
     return ap, e_p, i_p, Omega_p, omega_p, f_p
 
 
@@ -1041,16 +1732,16 @@ def vector_to_classical_elements_mean(
                             )
     :rtype:             tuple
     """
+    # resolve the planet properties once so that only numeric values are passed to the conversions
+    mu = get_planet_mu(planet)
+    req = get_planet_property(planet=planet, property="REQ")
+    j2 = get_planet_property(planet=planet, property="J2")
     # calculate the osculating orbital elements
-    sma_osc, ecc_osc, inc_osc, raan_osc, aop_osc, ta_osc = vector_to_classical_elements(
-        r_bn_n=r_bn_n,
-        v_bn_n=v_bn_n,
-        planet=planet
-    )
+    sma_osc, ecc_osc, inc_osc, raan_osc, aop_osc, ta_osc = _vector_to_classical_elements(r_bn_n, v_bn_n, mu)
     # convert the osculating orbital elements to mean orbital elements
     sma_mean, ecc_mean, inc_mean, raan_mean, aop_mean, ta_mean = mean_to_osculating_elements(
-        req=get_planet_property(planet=planet, property="REQ"),
-        j2=get_planet_property(planet=planet, property="J2"),
+        req=req,
+        j2=j2,
         semi_major_axis=sma_osc,
         eccentricity=ecc_osc,
         inclination=inc_osc,
@@ -1063,33 +1754,35 @@ def vector_to_classical_elements_mean(
 
 
 def classical_to_non_singular_elements(
-        semi_major_axis: float,
-        eccentricity: float,
-        inclination: float,
-        right_ascension: float,
-        argument_of_periapsis: float,
-        true_anomaly: float
-) -> Tuple[float, float, float, float, float, float]:
+        semi_major_axis: float | np.ndarray,
+        eccentricity: float | np.ndarray,
+        inclination: float | np.ndarray,
+        right_ascension: float | np.ndarray,
+        argument_of_periapsis: float | np.ndarray,
+        true_anomaly: float | np.ndarray
+) -> np.ndarray:
     """
     convert classical orbital elements to non-singular orbital elements as defined in the PhD Thesis:
     D’Amico, S. (2010). Autonomous Formation Flying in Low Earth Orbit [Delft University of Technology].
     http://www.narcis.nl/publication/RecordID/oai:tudelft.nl:uuid:a10e2d63-399d-48e5-884b-402e9a105c70, Page 21
 
-    This set of non-singular orbital elements are often used to parameterize the relative motion between two spacecraft
+    This set of non-singular orbital elements are often used to parameterize the relative motion between two spacecraft.
+    The function is vectorized, so the elements may be scalars or broadcastable arrays of shape (N,).
 
     :param semi_major_axis:        Semi-major axis of the orbit in meters
-    :type semi_major_axis:         float
+    :type semi_major_axis:         float | np.ndarray
     :param eccentricity:          Eccentricity of the orbit
-    :type eccentricity:           float
+    :type eccentricity:           float | np.ndarray
     :param inclination:          Inclination of the orbit in radians
-    :type inclination:           float
+    :type inclination:           float | np.ndarray
     :param right_ascension:     Right ascension of the ascending node in radians
-    :type right_ascension:      float
+    :type right_ascension:      float | np.ndarray
     :param argument_of_periapsis: Argument of periapsis in radians
-    :type argument_of_periapsis:  float
+    :type argument_of_periapsis:  float | np.ndarray
     :param true_anomaly:        True anomaly at the epoch in radians
-    :type true_anomaly:         float
-    :return:                   A tuple containing the non-singular orbital elements
+    :type true_anomaly:         float | np.ndarray
+    :return:                   An array of shape (6,) for scalar inputs, or (N, 6) for array inputs, containing the
+                                    non-singular orbital elements
                                     (
                                         semi_major_axis,
                                         e_x: x component of eccentricity,
@@ -1098,9 +1791,9 @@ def classical_to_non_singular_elements(
                                         right_ascension,
                                         mean argument of latitude
                                     )
-    :rtype:                    tuple
+    :rtype:                    np.ndarray
     """
-    return (
+    return np.stack(np.broadcast_arrays(
         semi_major_axis,
         eccentricity * np.cos(argument_of_periapsis),  # x component of eccentricity
         eccentricity * np.sin(argument_of_periapsis),  # y component of eccentricity
@@ -1111,28 +1804,31 @@ def classical_to_non_singular_elements(
                 true_anomaly,
                 eccentricity)
         )
-    )
+    ), axis=-1)
 
 
 def non_singular_to_relative_elements(
-        semi_major_axis_leader: float,
-        e_x_leader: float,
-        e_y_leader: float,
-        inclination_leader: float,
-        right_ascension_leader: float,
-        mean_argument_of_latitude_leader: float,
-        semi_major_axis_follower: float,
-        e_x_follower: float,
-        e_y_follower: float,
-        inclination_follower: float,
-        right_ascension_follower: float,
-        mean_argument_of_latitude_follower: float,
+        semi_major_axis_leader: float | np.ndarray,
+        e_x_leader: float | np.ndarray,
+        e_y_leader: float | np.ndarray,
+        inclination_leader: float | np.ndarray,
+        right_ascension_leader: float | np.ndarray,
+        mean_argument_of_latitude_leader: float | np.ndarray,
+        semi_major_axis_follower: float | np.ndarray,
+        e_x_follower: float | np.ndarray,
+        e_y_follower: float | np.ndarray,
+        inclination_follower: float | np.ndarray,
+        right_ascension_follower: float | np.ndarray,
+        mean_argument_of_latitude_follower: float | np.ndarray,
 ) -> Tuple[float, float, float, float, float, float]:
     """
     Convert non-singular orbital elements to relative orbital elements as defined in the PhD Thesis:
     D’Amico, S. (2010). Autonomous Formation Flying in Low Earth Orbit [Delft University of Technology].
     http://www.narcis.nl/publication/RecordID/oai:tudelft.nl:uuid:a10e2d63-399d-48e5-884b-402e9a105c70, Page 21
 
+    The computation is purely elementwise, so each element may also be an array of shape (N,) in which case each of
+    the returned relative elements is an array of shape (N,).
+
     :param semi_major_axis_leader: Semi-major axis of the leader's orbit in meters
     :type semi_major_axis_leader: float
     :param e_x_leader: x component of the leader's eccentricity
@@ -1250,7 +1946,7 @@ def classical_to_relative_elements(
         right_ascension_leader,
         argument_of_periapsis_leader,
         true_anomaly_leader
-    )
+    ).T
     (
         semi_major_axis_follower,
         e_x_follower,
@@ -1265,7 +1961,7 @@ def classical_to_relative_elements(
         right_ascension_follower,
         argument_of_periapsis_follower,
         true_anomaly_follower
-    )
+    ).T
     # convert the non-singular orbital elements to relative orbital elements
     return non_singular_to_relative_elements(
         semi_major_axis_leader,
@@ -1317,20 +2013,14 @@ def vector_to_relative_elements(
                 )
     :rtype: tuple
     """
+    # find the gravitational parameter for the planet once for both spacecraft
+    mu = get_planet_mu(planet)
     # calculate the classical elements from the vector elements
     return classical_to_relative_elements(
         # unpack the output of the vector to classical elements function
-        *vector_to_classical_elements(
-            r_bn_n=r_bn_n_leader,
-            v_bn_n=v_bn_n_leader,
-            planet=planet,
-        ),
+        *_vector_to_classical_elements(r_bn_n_leader, v_bn_n_leader, mu),
         # unpack the output of the vector to classical elements function
-        *vector_to_classical_elements(
-            r_bn_n=r_bn_n_follower,
-            v_bn_n=v_bn_n_follower,
-            planet=planet,
-        )
+        *_vector_to_classical_elements(r_bn_n_follower, v_bn_n_follower, mu)
     )
 
 
@@ -1392,8 +2082,9 @@ def classical_to_relative_elements_mean(
                 )
     :rtype: tuple
 """
+    # resolve the planet properties once so that only numeric values are passed to the conversions
     req = get_planet_property(planet=planet, property="REQ")
-    j2 = get_planet_property(planet=planet, property="j2")
+    j2 = get_planet_property(planet=planet, property="J2")
     ce_leader_mean = mean_to_osculating_elements(
         semi_major_axis=semi_major_axis_leader,
         eccentricity=eccentricity_leader,
@@ -1466,20 +2157,15 @@ def vector_to_relative_elements_mean(
                 )
     :rtype: tuple
     """
+    # find the gravitational parameter for the planet once for both spacecraft
+    mu = get_planet_mu(planet)
     # calculate the classical elements from the vector elements
     return classical_to_relative_elements_mean(
         # unpack the output of the vector to classical elements function
-        *vector_to_classical_elements(
-            r_bn_n=r_bn_n_leader,
-            v_bn_n=v_bn_n_leader,
-            planet=planet,
-        ),
+        *_vector_to_classical_elements(r_bn_n_leader, v_bn_n_leader, mu),
         # unpack the output of the vector to classical elements function
-        *vector_to_classical_elements(
-            r_bn_n=r_bn_n_follower,
-            v_bn_n=v_bn_n_follower,
-            planet=planet,
-        )
+        *_vector_to_classical_elements(r_bn_n_follower, v_bn_n_follower, mu),
+        planet=planet
     )
 
 
@@ -1503,7 +2189,9 @@ def argument_of_latitude(argument_of_periapsis: float, anomaly: float, angle_max
     :return:                        [rad] Argument of latitude
     :rtype:                         float
     """
-    return utils.normalize_angle(argument_of_periapsis + anomaly, angle_max=angle_max)
+    # wrap inline rather than through utils.normalize_angle; the floored modulo already maps negative sums into
+    #   [0, angle_max) and applies element-wise to arrays
+    return (argument_of_periapsis + anomaly) % angle_max
 
 
 def period(semi_major_axis: float, planet="earth") -> float:
@@ -1522,8 +2210,8 @@ def period(semi_major_axis: float, planet="earth") -> float:
         raise ValueError("Semi-major axis must be positive")
     # calculate the gravitational parameter of the central body
     mu = get_planet_mu(planet)
-    # calculate the orbital period
-    return 2 * np.pi * np.sqrt(semi_major_axis ** 3 / mu)
+    # calculate the orbital period, using a * sqrt(a / mu) to avoid evaluating a^3 with pow
+    return _TWO_PI * semi_major_axis * math.sqrt(semi_major_axis / mu)
 
 
 def mean_motion(semi_major_axis: float, planet="earth") -> float:
@@ -1543,7 +2231,7 @@ def mean_motion(semi_major_axis: float, planet="earth") -> float:
     # calculate the gravitational parameter of the central body
     mu = get_planet_mu(planet)
     # calculate the mean motion
-    return np.sqrt(mu / semi_major_axis ** 3)
+    return math.sqrt(mu / (semi_major_axis * semi_major_axis * semi_major_axis))
 
 
 def t_lvlh_eci(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray) -> np.ndarray:
@@ -1563,15 +2251,26 @@ def t_lvlh_eci(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray) -> np.ndarray
     ]
     :rtype np.ndarray
     """
+    # the frame is built from 3-vector products written out component-wise, which avoids the per-call
+    #   overhead of np.cross and np.linalg.norm on such small arrays. the components are cast to floats so that
+    #   integer input cannot overflow in the products
+    rx, ry, rz = float(r_bn_n_chief[0]), float(r_bn_n_chief[1]), float(r_bn_n_chief[2])
+    vx, vy, vz = float(v_bn_n_chief[0]), float(v_bn_n_chief[1]), float(v_bn_n_chief[2])
     # Normalize the chief's position vector to get the radial direction (i_r)
-    i_r = r_bn_n_chief / np.linalg.norm(r_bn_n_chief)
+    inv_r = 1.0 / math.sqrt(rx * rx + ry * ry + rz * rz)
+    i_rx, i_ry, i_rz = rx * inv_r, ry * inv_r, rz * inv_r
     # Compute the orbital angular momentum vector (h) and normalize it to get i_h
-    h = np.cross(r_bn_n_chief, v_bn_n_chief)
-    i_h = h / np.linalg.norm(h)
-    # Compute the transverse direction (i_theta) as the cross product of i_h and i_r
-    i_theta = np.cross(i_h, i_r)
-    # create the transformation matrix
-    return np.vstack((i_r, i_theta, i_h)).T  # Arrange the unit vectors as columns
+    hx = ry * vz - rz * vy
+    hy = rz * vx - rx * vz
+    hz = rx * vy - ry * vx
+    inv_h = 1.0 / math.sqrt(hx * hx + hy * hy + hz * hz)
+    i_hx, i_hy, i_hz = hx * inv_h, hy * inv_h, hz * inv_h
+    # create the transformation matrix, arranging i_r, i_theta = i_h x i_r and i_h as columns
+    return np.array([
+        [i_rx, i_hy * i_rz - i_hz * i_ry, i_hx],
+        [i_ry, i_hz * i_rx - i_hx * i_rz, i_hy],
+        [i_rz, i_hx * i_ry - i_hy * i_rx, i_hz]
+    ])
 
 
 def t_dot_lvlh_eci(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, a_bn_n_chief: np.ndarray = None) -> np.ndarray:
@@ -1583,7 +2282,8 @@ def t_dot_lvlh_eci(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, a_bn_n_ch
     :type np.ndarray
     :param v_bn_n_chief: Velocity vector of the chief spacecraft in the ECI frame relative to the ECI frame
     :type np.ndarray
-    :param a_bn_n_chief: Acceleration vector of the chief spacecraft in the ECI frame relative to the ECI frame
+    :param a_bn_n_chief: Acceleration vector of the chief spacecraft in the ECI frame relative to the ECI frame. If
+        omitted, the chief is taken to be unperturbed, so its angular momentum and orbit normal are constant
     :type np.ndarray
 
     :returns the time derivative of the transformation matrix from ECI to LVLH centred on the chief spacecraft
@@ -1594,22 +2294,75 @@ def t_dot_lvlh_eci(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, a_bn_n_ch
     ]
     :rtype np.ndarray
     """
-    # set the acceleration to a default value of zero
+    return _dcm_and_dcm_dot_eci_to_lvlh(r_bn_n_chief, v_bn_n_chief, a_bn_n_chief)[1].T
+
+
+def _cross3(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Calculates the cross product of two 3-vectors from their components. For single vectors this
+    is considerably cheaper than np.cross, which carries general broadcasting overhead.
+
+    :param a:   The first vector
+    :type a:    np.ndarray
+    :param b:   The second vector
+    :type b:    np.ndarray
+    :return:    The cross product a x b
+    :rtype:     np.ndarray
+    """
+    return np.array((
+        a[1] * b[2] - a[2] * b[1],
+        a[2] * b[0] - a[0] * b[2],
+        a[0] * b[1] - a[1] * b[0]
+    ))
+
+
+def _dcm_and_dcm_dot_eci_to_lvlh(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, a_bn_n_chief: np.ndarray = None) -> tuple:
+    """
+    Calculate the direction cosine matrix from ECI to LVLH and its time derivative together, sharing the unit vectors
+    and the specific angular momentum between the two. The rows of the DCM are the LVLH unit vectors, so it is the
+    transpose of t_lvlh_eci and maps an inertial vector into LVLH with a plain C-ordered product, dcm @ x.
+
+    :param r_bn_n_chief: Position vector of the chief spacecraft in the ECI frame relative to the ECI frame
+    :type np.ndarray
+    :param v_bn_n_chief: Velocity vector of the chief spacecraft in the ECI frame relative to the ECI frame
+    :type np.ndarray
+    :param a_bn_n_chief: Acceleration vector of the chief spacecraft in the ECI frame relative to the ECI frame
+    :type np.ndarray
+
+    :returns the direction cosine matrix from ECI to LVLH and its time derivative
+    :rtype tuple
+    """
+    r_bn_n_chief = np.asarray(r_bn_n_chief, dtype=np.float64)
+    v_bn_n_chief = np.asarray(v_bn_n_chief, dtype=np.float64)
+    # calculate the unit radial vector
+    r_mag = math.sqrt(r_bn_n_chief @ r_bn_n_chief)
+    ex_hat = r_bn_n_chief / r_mag
+    # calculate the specific angular momentum vector and the unit normal vector
+    h = _cross3(r_bn_n_chief, v_bn_n_chief)
+    h_mag = math.sqrt(h @ h)
+    ez_hat = h / h_mag
+    # calculate the unit transverse vector
+    ey_hat = _cross3(ez_hat, ex_hat)
+    # calculate the time derivatives of each unit vector, reusing the unit vectors computed above
+    ex_hat_dot = (v_bn_n_chief - (ex_hat @ v_bn_n_chief) * ex_hat) / r_mag
     if a_bn_n_chief is None:
-        a_bn_n_chief = np.zeros_like(r_bn_n_chief, dtype=np.float64)
-    # Calculate the transformation matrix
-    T = t_lvlh_eci(r_bn_n_chief=r_bn_n_chief, v_bn_n_chief=v_bn_n_chief)
-    ex_hat = T[:, 0]
-    ez_hat = T[:, 2]
-    # calculate the specific angular momentum vector
-    h = np.cross(r_bn_n_chief, v_bn_n_chief)
-    # calculate the time derivative of the specific angular momentum vector
-    h_dot = np.cross(r_bn_n_chief, a_bn_n_chief)
-    # calculate the time derivatives of each unit vector
-    ex_hat_dot = utils.unit_vector_derivative(r_bn_n_chief, v_bn_n_chief)
-    ez_hat_dot = utils.unit_vector_derivative(h, h_dot)
-    ey_hat_dot = np.cross(ez_hat_dot, ex_hat) + np.cross(ez_hat, ex_hat_dot)
-    return np.array([ex_hat_dot, ey_hat_dot, ez_hat_dot]).T
+        # without an acceleration the angular momentum is constant, so the normal vector does not rotate
+        ez_hat_dot = np.zeros(3)
+        ey_hat_dot = _cross3(ez_hat, ex_hat_dot)
+    else:
+        h_dot = _cross3(r_bn_n_chief, a_bn_n_chief)
+        ez_hat_dot = (h_dot - (ez_hat @ h_dot) * ez_hat) / h_mag
+        ey_hat_dot = _cross3(ez_hat_dot, ex_hat) + _cross3(ez_hat, ex_hat_dot)
+    # write the unit vectors and their derivatives straight into the rows of preallocated matrices
+    dcm = np.empty((3, 3))
+    dcm[0] = ex_hat
+    dcm[1] = ey_hat
+    dcm[2] = ez_hat
+    dcm_dot = np.empty((3, 3))
+    dcm_dot[0] = ex_hat_dot
+    dcm_dot[1] = ey_hat_dot
+    dcm_dot[2] = ez_hat_dot
+    return dcm, dcm_dot
 
 
 def relative_state_lvlh(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, r_bn_n_deputy: np.ndarray, v_bn_n_deputy: np.ndarray) -> np.ndarray:
@@ -1625,22 +2378,45 @@ def relative_state_lvlh(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, r_bn
     :param v_bn_n_deputy: Velocity vector of the deputy spacecraft in the ECI frame relative to the ECI frame
     :type np.ndarray
     """
-    # calculate the transformation matrix for the transformation
-    T = t_lvlh_eci(r_bn_n_chief=r_bn_n_chief, v_bn_n_chief=v_bn_n_chief)
-    T_dot = t_dot_lvlh_eci(
-        r_bn_n_chief=r_bn_n_chief,
-        v_bn_n_chief=v_bn_n_chief,
-    )
+    # calculate the direction cosine matrix for the transformation
+    dcm, dcm_dot = _dcm_and_dcm_dot_eci_to_lvlh(r_bn_n_chief, v_bn_n_chief)
     # calculate the relative states of the deputy relative to the chief in ECI about ECI
     r_rel_bn_n = r_bn_n_deputy - r_bn_n_chief
     v_rel_bn_n = v_bn_n_deputy - v_bn_n_chief
     # transform the inertial relative state into LVLH coordinates centred on the chief spacecraft
-    r_rel_lvlh = T.T @ r_rel_bn_n
-    v_rel_lvlh = T_dot.T @ r_rel_bn_n + T.T @ v_rel_bn_n
+    r_rel_lvlh = dcm @ r_rel_bn_n
+    v_rel_lvlh = dcm_dot @ r_rel_bn_n + dcm @ v_rel_bn_n
     return np.hstack((r_rel_lvlh, v_rel_lvlh))
 
 
-def future_relative_state_cw(omega: float, initial_state: np.ndarray, accelerations: np.ndarray, t: float) -> np.ndarray:
+def relative_state_lvlh_batch(r_bn_n_chief: np.ndarray, v_bn_n_chief: np.ndarray, r_bn_n_deputies: np.ndarray, v_bn_n_deputies: np.ndarray) -> np.ndarray:
+    """
+    Calculate the relative positions and velocities of many deputy spacecraft relative to a single chief spacecraft
+
+    :param r_bn_n_chief: Position vector of the chief spacecraft in the ECI frame relative to the ECI frame
+    :type np.ndarray
+    :param v_bn_n_chief: Velocity vector of the chief spacecraft in the ECI frame relative to the ECI frame
+    :type np.ndarray
+    :param r_bn_n_deputies: Position vectors of the deputy spacecraft in the ECI frame relative to the ECI frame, (N, 3)
+    :type np.ndarray
+    :param v_bn_n_deputies: Velocity vectors of the deputy spacecraft in the ECI frame relative to the ECI frame, (N, 3)
+    :type np.ndarray
+
+    :returns the relative states of the deputies in LVLH coordinates centred on the chief spacecraft, one per row (N, 6)
+    :rtype np.ndarray
+    """
+    # calculate the transformation matrix and its derivative once for all the deputies
+    dcm, dcm_dot = _dcm_and_dcm_dot_eci_to_lvlh(r_bn_n_chief, v_bn_n_chief)
+    # calculate the relative states of the deputies relative to the chief in ECI about ECI
+    r_rel_bn_n = np.asarray(r_bn_n_deputies, dtype=np.float64) - r_bn_n_chief
+    v_rel_bn_n = np.asarray(v_bn_n_deputies, dtype=np.float64) - v_bn_n_chief
+    # transform the rows of inertial relative states into LVLH coordinates, (dcm @ x).T == x.T @ dcm.T
+    r_rel_lvlh = r_rel_bn_n @ dcm.T
+    v_rel_lvlh = r_rel_bn_n @ dcm_dot.T + v_rel_bn_n @ dcm.T
+    return np.hstack((r_rel_lvlh, v_rel_lvlh))
+
+
+def future_relative_state_cw(omega: float, initial_state: np.ndarray, accelerations: np.ndarray, t: float | np.ndarray) -> np.ndarray:
     """
     Calculate the future relative positions and velocities (x, y, z, dot_x, dot_y, dot_z)
     using the state transition matrix based on the analytical solutions to the Clohessy-Wiltshire
@@ -1656,64 +2432,68 @@ def future_relative_state_cw(omega: float, initial_state: np.ndarray, accelerati
     :param accelerations: The vector of constant accelerations in the x, y, and z directions [ax, ay, az].
     :type accelerations: numpy.ndarray
 
-    :param t: The time at which the future state is sought (seconds).
-    :type t: float
+    :param t: The time at which the future state is sought (seconds). An array of N times may be
+              passed to propagate a whole trajectory in one call.
+    :type t: float | numpy.ndarray
 
-    :return: The future state vector containing relative positions and velocities [x, y, z, dot_x, dot_y, dot_z] at time t.
+    :return: The future state vector containing relative positions and velocities [x, y, z, dot_x, dot_y, dot_z] at time t,
+             or an (N, 6) array with one state per row if t is an array.
     :rtype: numpy.ndarray
 
     This function computes the future state by applying the state transition matrix to the
     initial state and incorporating the effect of constant accelerations. The analytical
     expressions for the state transition matrix and the effect of constant accelerations are
-    derived from the Clohessy-Wiltshire equations.
+    derived from the Clohessy-Wiltshire equations. Only the non-zero entries of both matrices
+    are evaluated, each written out as part of its output component.
 
     Example usage:
     >>> omega = 0.001  # Example orbital angular velocity in rad/s
     >>> initial_state = np.array([10, 0, 0, 0, 0, 0])  # Example initial state
     >>> accelerations = np.array([0, 0, 0])  # Example: No acceleration
     >>> t = 600  # Future state after 10 minutes
-    >>> future_state = calculate_future_state_with_matrix(omega, initial_state, accelerations, t)
+    >>> future_state = future_relative_state_cw(omega, initial_state, accelerations, t)
     >>> print(future_state)
     """
-    # Pre-compute common terms
-    sin_omega_t = np.sin(omega * t)
-    cos_omega_t = np.cos(omega * t)
-    sin_2omega_t = np.sin(2 * omega * t)
-    cos_2omega_t = np.cos(2 * omega * t)
-
-    # Construct the state transition matrix for the CW equations
-    phi = np.array([
-        [4 - 3 * cos_omega_t, 0, 0, sin_omega_t / omega, (2 / omega) * (1 - cos_omega_t), 0],
-        [6 * (sin_omega_t - omega * t), 1, 0, -(2 / omega) * (1 - cos_omega_t),
-         (4 * sin_omega_t - 3 * omega * t) / omega, 0],
-        [0, 0, cos_omega_t, 0, 0, sin_omega_t / omega],
-        [3 * omega * sin_omega_t, 0, 0, cos_omega_t, 2 * sin_omega_t, 0],
-        [-6 * omega * (1 - cos_omega_t), 0, 0, -2 * sin_omega_t, 4 * cos_omega_t - 3, 0],
-        [0, 0, -omega * sin_omega_t, 0, 0, cos_omega_t]
-    ])
+    # unpack the initial state and the accelerations
+    x0, y0, z0, vx0, vy0, vz0 = initial_state
+    ax, ay, az = accelerations
 
-    # Construct the acceleration effect matrix
-    acc_effect = np.array([
-        [
-            -1/omega**2*cos_omega_t + 1/omega**2,
-            2*t/omega - 2*sin_omega_t/omega**2,
-            0
-        ],
-        [
-            -2*t/omega + 2*sin_omega_t/omega**2,
-            -3*t**2/2.0 - 4*cos_omega_t/omega**2 + 4/omega**2,
-            0
-        ],
-        [0, 0, -1/omega**2*cos_omega_t + 1/omega**2],
-        [1/omega*sin_omega_t, 2/omega - 2*cos_omega_t/omega, 0],
-        [-2/omega + 2*cos_omega_t/omega, -3*t + 4/omega*sin_omega_t, 0],
-        [0, 0, 1/omega*sin_omega_t]
-    ])
-
-    # Compute the future state
-    future_state = phi @ initial_state + acc_effect @ accelerations
-
-    return future_state
+    # pre-compute common terms, for either a single time or an array of sample times
+    if np.isscalar(t):
+        omega_t = omega * t
+        sin_omega_t = math.sin(omega_t)
+        cos_omega_t = math.cos(omega_t)
+    else:
+        t = np.asarray(t, dtype=float)
+        omega_t = omega * t
+        sin_omega_t = np.sin(omega_t)
+        cos_omega_t = np.cos(omega_t)
+    inv_omega = 1 / omega
+    # the transition terms are built from these few ratios, which are each formed once
+    sin_over_omega = sin_omega_t * inv_omega
+    sin_over_omega2 = sin_over_omega * inv_omega
+    one_minus_cos = 1 - cos_omega_t
+    one_minus_cos_over_omega = one_minus_cos * inv_omega
+    one_minus_cos_over_omega2 = one_minus_cos_over_omega * inv_omega
+    t_over_omega = t * inv_omega
+
+    # apply the non-zero terms of the CW state transition matrix and the acceleration effect matrix
+    #   directly, rather than building both matrices and multiplying them out. stacking on the last axis gives a
+    #   (6,) state for a scalar time and an (N, 6) trajectory for an array of times
+    return np.stack([
+        (4 - 3 * cos_omega_t) * x0 + sin_over_omega * vx0 + 2 * one_minus_cos_over_omega * vy0
+        + one_minus_cos_over_omega2 * ax + 2 * (t_over_omega - sin_over_omega2) * ay,
+        6 * (sin_omega_t - omega_t) * x0 + y0 - 2 * one_minus_cos_over_omega * vx0
+        + (4 * sin_over_omega - 3 * t) * vy0
+        + 2 * (sin_over_omega2 - t_over_omega) * ax
+        + (4 * one_minus_cos_over_omega2 - 1.5 * t * t) * ay,
+        cos_omega_t * z0 + sin_over_omega * vz0 + one_minus_cos_over_omega2 * az,
+        3 * omega * sin_omega_t * x0 + cos_omega_t * vx0 + 2 * sin_omega_t * vy0
+        + sin_over_omega * ax + 2 * one_minus_cos_over_omega * ay,
+        -6 * omega * one_minus_cos * x0 - 2 * sin_omega_t * vx0 + (4 * cos_omega_t - 3) * vy0
+        - 2 * one_minus_cos_over_omega * ax + (4 * sin_over_omega - 3 * t) * ay,
+        -omega * sin_omega_t * z0 + cos_omega_t * vz0 + sin_over_omega * az
+    ], axis=-1)
 
 
 def get_sun_synchronous_inclination_estimate(
@@ -1722,7 +2502,8 @@ def get_sun_synchronous_inclination_estimate(
         planet_radius: float,
         planet_semi_major_axis: float,
         planet_j2: float,
-        planet: str
+        planet: str,
+        mean_motion_body: float = None
 ):
     """
     Calculates the sun synchronous inclination estimate based on the position
@@ -1741,13 +2522,48 @@ def get_sun_synchronous_inclination_estimate(
     :type planet_j2: float
     :param planet: [m^3 s^-2] The gravitational Mu parameter of the parent of the orbital body
     :type planet: str
+    :param mean_motion_body: [s^-2] The mean motion of the orbiting body about its parent, if already known. When
+                             given, the planet and its semi-major axis are not used to recompute it
+    :type mean_motion_body: float
+    :return: [rad] The estimated inclination of the orbit
+    :rtype: float
+    """
+    if mean_motion_body is None:
+        mean_motion_body = mean_motion(planet=planet, semi_major_axis=planet_semi_major_axis)
+    return _sun_synchronous_inclination_estimate(
+        orbit_mean_motion, semi_latus_rectum, planet_radius, planet_j2, mean_motion_body
+    )
+
+
+def _sun_synchronous_inclination_estimate(
+        orbit_mean_motion: float,
+        semi_latus_rectum: float,
+        planet_radius: float,
+        planet_j2: float,
+        mean_motion_body: float
+) -> float:
+    """
+    Calculates the sun synchronous inclination estimate from an already evaluated
+    mean motion of the orbiting body about its parent, so that iterative solvers do
+    not need to look up the planet constants on every step.
+
+    :param orbit_mean_motion: [s^-2] The mean motion of the orbit
+    :type orbit_mean_motion: float
+    :param semi_latus_rectum: [m] The semi-latus rectum of the orbit
+    :type semi_latus_rectum: float
+    :param planet_radius: [m] The radius of the orbiting body
+    :type planet_radius: float
+    :param planet_j2: [-] The orbiting body J2 value
+    :type planet_j2: float
+    :param mean_motion_body: [s^-2] The mean motion of the orbiting body about its parent
+    :type mean_motion_body: float
     :return: [rad] The estimated inclination of the orbit
     :rtype: float
     """
-    mean_motion_body = mean_motion(planet=planet, semi_major_axis=planet_semi_major_axis)
     value = -2.0 * (semi_latus_rectum / planet_radius)**2 * mean_motion_body / (3.0 * orbit_mean_motion * planet_j2)
-    value = max(0.0, min(np.fabs(value), np.pi)) * np.sign(value)
-    return np.arccos(value)
+    value = max(0.0, min(math.fabs(value), math.pi)) * math.copysign(1.0, value)
+    # math.acos raises outside [-1, 1] where np.arccos returned NaN, so keep NaN for unreachable inclinations
+    return math.acos(value) if math.fabs(value) <= 1.0 else math.nan
 
 
 def semi_lactus_rectum(semi_major_axis: float, eccentricity: float) -> float:
@@ -1764,6 +2580,25 @@ def semi_lactus_rectum(semi_major_axis: float, eccentricity: float) -> float:
     return semi_major_axis * (1 - eccentricity * eccentricity)
 
 
+@lru_cache(maxsize=32)
+def _sun_synchronous_planet_constants(planet: str) -> tuple:
+    """
+    Returns the planet constants used to solve for a sun synchronous inclination. These
+    only depend on the planet, so they are cached for sweeps over many orbits.
+
+    :param planet: [-] The orbiting planet to orbit around
+    :type planet: str
+    :return: The equatorial radius [m], the J2 value [-] and the mean motion of the planet
+             about its parent [s^-1]
+    :rtype: tuple
+    """
+    req = get_planet_property(planet=planet, property="REQ")
+    j2 = get_planet_property(planet=planet, property="j2")
+    orbit_semi_major_axis = get_planet_property(planet=planet, property="orbit_sma")
+    mean_motion_body = mean_motion(planet=planet, semi_major_axis=orbit_semi_major_axis)
+    return req, j2, mean_motion_body
+
+
 def sun_synchronous_inclination(planet: str, semi_major_axis: float, eccentricity: float = 0.0) -> float:
     """
     Returns the inclination in radians of a defined SSO orbit based on the semi major axis and desired
@@ -1779,39 +2614,30 @@ def sun_synchronous_inclination(planet: str, semi_major_axis: float, eccentricit
     :rtype: float
     """
     n = mean_motion(planet=planet, semi_major_axis=semi_major_axis)
-    p = semi_lactus_rectum(semi_major_axis, eccentricity)
+    # the semi-latus rectum, inlined from semi_lactus_rectum since 1 - e^2 is reused below
+    one_minus_e2 = 1 - eccentricity * eccentricity
+    p = semi_major_axis * one_minus_e2
 
-    mu = get_planet_mu(planet=planet)
-    req = get_planet_property(planet=planet, property="REQ")
-    j2 = get_planet_property(planet=planet, property="j2")
-    orbit_semi_major_axis = get_planet_property(planet=planet, property="orbit_sma")
+    req, j2, mean_motion_body = _sun_synchronous_planet_constants(planet)
 
-    i0 = get_sun_synchronous_inclination_estimate(
+    # the SSO condition is cos(i) * (1 + k * (1 - 1.5 sin^2(i))) + c = 0, where the J2 perturbed mean motion of the
+    #   orbit has been expanded. solve it with Newton's method, starting from the unperturbed estimate
+    k = 1.5 * j2 * (req / p)**2 * math.sqrt(one_minus_e2)
+    c = 2.0 * (p / req)**2 * mean_motion_body / (3.0 * n * j2)
+    inclination = _sun_synchronous_inclination_estimate(
         orbit_mean_motion=n,
         semi_latus_rectum=p,
         planet_radius=req,
-        planet_semi_major_axis=orbit_semi_major_axis,
         planet_j2=j2,
-        planet=planet
+        mean_motion_body=mean_motion_body
     )
-    inclination = 0.0
-
-    it = 0
-    error = 1.0
-    # Iterate to find the inclination
-    while error >= 1e-6 and it < 100:
-        mean_motion_j2 = n * (1 + 1.5 * j2 * (req / p)**2 * np.sqrt(1 - eccentricity * eccentricity) * (1 - 1.5 * np.sin(i0)**2))
-        inclination = get_sun_synchronous_inclination_estimate(
-            orbit_mean_motion=mean_motion_j2,
-            semi_latus_rectum=p,
-            planet_radius=req,
-            planet_semi_major_axis=orbit_semi_major_axis,
-            planet_j2=j2,
-            planet=planet
-        )
-
-        error = abs(inclination - i0)
-        i0 = inclination
-        it += 1
+    for _ in range(20):
+        sin_i = math.sin(inclination)
+        cos_i = math.cos(inclination)
+        scale = 1 + k * (1 - 1.5 * sin_i * sin_i)
+        delta = (cos_i * scale + c) / (-sin_i * scale - 3 * k * sin_i * cos_i * cos_i)
+        inclination -= delta
+        if abs(delta) < 1e-10:
+            break
 
     return inclination
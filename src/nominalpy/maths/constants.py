@@ -9,6 +9,8 @@ as well as astrophysical constants. These include planetary data
 and useful values that can be used for conversions.
 '''
 
+import numpy as np
+
 M_PI: float = 3.141592653589793
 '''[-] The value of PI'''
 
@@ -81,8 +83,8 @@ MERCURY_J2: float = 60.0e-6
 MERCURY_ORBIT_SMA: float = 0.38709893 * AU
 '''[m] Mercury Semi-Major Axis of it's orbit'''
 
-MERCURY_ORBIT_INC: float = 7.00487 * D2R
-'''[rad] The axis inclination of Mercury's orbit'''
+MERCURY_ORBIT_INC: float = 0.1222580451741752
+'''[rad] The axis inclination of Mercury's orbit (7.00487 deg)'''
 
 MERCURY_ORBIT_E: float = 0.20563069
 '''[-] The eccentricity for Mercury's orbit'''
@@ -115,8 +117,8 @@ VENUS_J2: float = 4.458e-6
 VENUS_ORBIT_SMA: float = 0.72333199 * AU
 '''[m] Venus Semi-Major Axis of its orbit'''
 
-VENUS_ORBIT_INC: float = 3.39471 * D2R
-'''[rad] The axis inclination of Venus's orbit'''
+VENUS_ORBIT_INC: float = 0.0592488666503767
+'''[rad] The axis inclination of Venus's orbit (3.39471 deg)'''
 
 VENUS_ORBIT_E: float = 0.00677323
 '''[-] The eccentricity for Venus's orbit'''
@@ -164,8 +166,8 @@ EARTH_J6: float = 0.57e-6
 EARTH_ORBIT_SMA: float = 1.00000011 * AU
 '''[m] Earth Semi-Major Axis of its orbit'''
 
-EARTH_ORBIT_INC: float = 0.00005 * D2R
-'''[rad] The axis inclination of Earth's orbit'''
+EARTH_ORBIT_INC: float = 8.726646259971648e-07
+'''[rad] The axis inclination of Earth's orbit (0.00005 deg)'''
 
 EARTH_ORBIT_E: float = 0.01671022
 '''[-] The eccentricity for Earth's orbit'''
@@ -234,8 +236,8 @@ MARS_J2: float = 1960.45e-6
 MARS_ORBIT_SMA: float = 1.52366231 * AU
 '''[m] Mars Semi-Major Axis of its orbit'''
 
-MARS_ORBIT_INC: float = 1.85061 * D2R
-'''[rad] The axis inclination of Mars's orbit'''
+MARS_ORBIT_INC: float = 0.03229923767033226
+'''[rad] The axis inclination of Mars's orbit (1.85061 deg)'''
 
 MARS_ORBIT_E: float = 0.09341233
 '''[-] The eccentricity for Mars's orbit'''
@@ -274,8 +276,8 @@ JUPITER_J2: float = 14736.0e-6
 JUPITER_ORBIT_SMA: float = 5.20336301 * AU
 '''[m] Jupiter Semi-Major Axis of its orbit'''
 
-JUPITER_ORBIT_INC: float = 1.30530 * D2R
-'''[rad] The axis inclination of Jupiter's orbit'''
+JUPITER_ORBIT_INC: float = 0.022781782726281983
+'''[rad] The axis inclination of Jupiter's orbit (1.30530 deg)'''
 
 JUPITER_ORBIT_E: float = 0.04839266
 '''[-] The eccentricity for Jupiter's orbit'''
@@ -308,8 +310,8 @@ SATURN_J2: float = 16298.0e-6
 SATURN_ORBIT_SMA: float = 9.53707032 * AU
 '''[m] Saturn Semi-Major Axis of its orbit'''
 
-SATURN_ORBIT_INC: float = 2.48446 * D2R
-'''[rad] The axis inclination of Saturn's orbit'''
+SATURN_ORBIT_INC: float = 0.04336200713409832
+'''[rad] The axis inclination of Saturn's orbit (2.48446 deg)'''
 
 SATURN_ORBIT_E: float = 0.05415060
 '''[-] The eccentricity for Saturn's orbit'''
@@ -342,8 +344,8 @@ URANUS_J2: float = 3343.43e-6
 URANUS_ORBIT_SMA: float = 19.19126393 * AU
 '''[m] Uranus Semi-Major Axis of its orbit'''
 
-URANUS_ORBIT_INC: float = 0.76986 * D2R
-'''[rad] The axis inclination of Uranus's orbit'''
+URANUS_ORBIT_INC: float = 0.013436591779403545
+'''[rad] The axis inclination of Uranus's orbit (0.76986 deg)'''
 
 URANUS_ORBIT_E: float = 0.04716771
 '''[-] The eccentricity for Uranus's orbit'''
@@ -376,8 +378,8 @@ NEPTUNE_J2: float = 3411.0e-6
 NEPTUNE_ORBIT_SMA: float = 30.06896348 * AU
 '''[m] Neptune Semi-Major Axis of its orbit'''
 
-NEPTUNE_ORBIT_INC: float = 1.76917 * D2R
-'''[rad] The axis inclination of Neptune's orbit'''
+NEPTUNE_ORBIT_INC: float = 0.03087784152750808
+'''[rad] The axis inclination of Neptune's orbit (1.76917 deg)'''
 
 NEPTUNE_ORBIT_E: float = 0.00858587
 '''[-] The eccentricity for Neptune's orbit'''
@@ -410,8 +412,8 @@ PLUTO_J2: float = 0.0
 PLUTO_ORBIT_SMA: float = 39.48168677 * AU
 '''[m] Pluto Semi-Major Axis of its orbit'''
 
-PLUTO_ORBIT_INC: float = 17.14175 * D2R
-'''[rad] The axis inclination of Pluto's orbit'''
+PLUTO_ORBIT_INC: float = 0.29917997705373794
+'''[rad] The axis inclination of Pluto's orbit (17.14175 deg)'''
 
 PLUTO_ORBIT_ECC: float = 0.24880766
 '''[-] The eccentricity for Pluto's orbit'''
@@ -426,4 +428,42 @@ PLUTO_DENSITY: float = 2095
 '''[kg/m^3] The density of Pluto'''
 
 PLUTO_ALBEDO_AVG: float = 0.0
-'''[-] A reflection albedo constant from Pluto's surface'''
\ No newline at end of file
+'''[-] A reflection albedo constant from Pluto's surface'''
+
+PLANET_NAMES: tuple = (
+    "sun", "mercury", "venus", "earth", "moon", "mars", "jupiter", "saturn", "uranus", "neptune", "pluto"
+)
+'''[-] The lowercase names of the bodies in the planet tables, in the order of their integer IDs'''
+
+PLANET_ID: dict = {name: index for index, name in enumerate(PLANET_NAMES)}
+'''[-] The integer ID of each body in the planet tables, keyed by the lowercase body name'''
+
+PLANET_MU: dict = {
+    "sun": SUN_MU,
+    "mercury": MERCURY_MU,
+    "venus": VENUS_MU,
+    "earth": EARTH_MU,
+    "moon": MOON_MU,
+    "mars": MARS_MU,
+    "jupiter": JUPITER_MU,
+    "saturn": SATURN_MU,
+    "uranus": URANUS_MU,
+    "neptune": NEPTUNE_MU,
+    "pluto": PLUTO_MU
+}
+'''[m^3/s^2] The gravitational constants of each body, keyed by the lowercase body name'''
+
+PLANET_MU_ARR: np.ndarray = np.array([PLANET_MU[name] for name in PLANET_NAMES], dtype=np.float64)
+'''[m^3/s^2] The gravitational constants of each body, indexed by the body's integer ID'''
+
+PLANET_REQ_ARR: np.ndarray = np.array([
+    SUN_REQ, MERCURY_REQ, VENUS_REQ, EARTH_REQ, MOON_REQ, MARS_REQ,
+    JUPITER_REQ, SATURN_REQ, URANUS_REQ, NEPTUNE_REQ, PLUTO_REQ
+], dtype=np.float64)
+'''[m] The equatorial radius of each body, indexed by the body's integer ID'''
+
+PLANET_J2_ARR: np.ndarray = np.array([
+    SUN_J2, MERCURY_J2, VENUS_J2, EARTH_J2, MOON_J2, MARS_J2,
+    JUPITER_J2, SATURN_J2, URANUS_J2, NEPTUNE_J2, PLUTO_J2
+], dtype=np.float64)
+'''[-] The J2 value of each body, indexed by the body's integer ID'''
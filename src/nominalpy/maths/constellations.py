@@ -3,43 +3,119 @@
 # to the public API. All code is under the the license provided along
 # with the 'nominalpy' module. Copyright Nominal Systems, 2024.
 
+import math
+from functools import lru_cache
 from abc import ABC, abstractmethod
-from collections.abc import Container
+from collections.abc import Container, Mapping, MutableMapping
 from typing import Dict, Optional, Union, List
 
 import numpy as np
 
-from ..maths.astro import classical_to_vector_elements, mean_to_osculating_elements, get_planet_property, \
-    argument_of_latitude
+from ..maths.astro import classical_to_vector_elements_batch, mean_to_osculating_elements, \
+    mean_to_osculating_elements_batch, get_planet_property, argument_of_latitude
 
 
-def state_vectors(method):
+# a full revolution in radians
+_TWO_PI: float = 2 * math.pi
+
+# the classical orbital elements of each spacecraft, in the order of the columns of the constellation's element array
+_ELEMENT_KEYS: tuple = (
+    "semi_major_axis",
+    "eccentricity",
+    "inclination",
+    "right_ascension",
+    "argument_of_periapsis",
+    "true_anomaly",
+)
+# the column of each classical orbital element in the constellation's element array
+_ELEMENT_INDEX: dict = {key: index for index, key in enumerate(_ELEMENT_KEYS)}
+# the keys held by the underlying dict of every spacecraft view, whose values are never read
+_ELEMENT_PLACEHOLDERS: dict = dict.fromkeys(_ELEMENT_KEYS)
+# the record of a single spacecraft's classical orbital elements, laid out identically to a row of the element array
+_ELEMENT_DTYPE: np.dtype = np.dtype([(key, np.float64) for key in _ELEMENT_KEYS])
+
+
+def _as_float(value) -> float:
     """
-    Decorator to convert a collection of orbital elements into their equivalent inertial state vectors
-    :param method: the method to be decorated
-    :return: the decorated method
+    Cast a value to a float, returning values that are already floats as they are
+    :param value: the value to cast
+    :return: the value as a float
     """
-    def wrapper(self, *args, **kwargs):
-        orbital_elements = method(self, *args, **kwargs)
-        result = dict()
-        # use dictionary comprehension to efficiently convert the state vectors to classical orbital elements
-        for i, elements in orbital_elements.items():
-            vectors = classical_to_vector_elements(
-                semi_major_axis=elements["semi_major_axis"],
-                eccentricity=elements["eccentricity"],
-                inclination=elements["inclination"],
-                right_ascension=elements["right_ascension"],
-                argument_of_periapsis=elements["argument_of_periapsis"],
-                true_anomaly=elements["true_anomaly"],
-                *args,
-                **kwargs
-            )
-            result[i] = {
-                "r_bn_n": np.array(vectors[0]),
-                "v_bn_n": np.array(vectors[1]),
-            }
-        return result
-    return wrapper
+    if type(value) is float:
+        return value
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        raise TypeError(f"The value {value!r} cannot be converted to a float") from None
+
+
+def _as_positive_float(value) -> float:
+    """
+    Cast a value to a float, ensuring that it is not negative
+    :param value: the value to cast
+    :return: the value as a float
+    """
+    value = _as_float(value)
+    if value < 0:
+        raise ValueError(f"The value {value} must not be negative")
+    return value
+
+
+@lru_cache(maxsize=32)
+def _planet_req_j2(planet: str) -> tuple:
+    """
+    Fetch the equatorial radius and J2 coefficient of a planet in a single cached lookup
+    :param planet: the name of the planet
+    :return: the equatorial radius and the J2 coefficient of the planet
+    """
+    return get_planet_property(planet, "REQ"), get_planet_property(planet, "J2")
+
+
+@lru_cache(maxsize=32)
+def _coplanar_offsets(num_satellites: int) -> np.ndarray:
+    """
+    Fetch the offsets in true anomaly of evenly phased spacecraft sharing a single orbit. These depend only on the
+        number of spacecraft and so are cached between calls
+    :param num_satellites: the number of spacecraft in the orbit
+    :return: the offset in true anomaly of each spacecraft, as a read-only array
+    """
+    true_anomaly_offsets = np.arange(num_satellites) * (_TWO_PI / num_satellites)
+    true_anomaly_offsets.flags.writeable = False
+    return true_anomaly_offsets
+
+
+@lru_cache(maxsize=32)
+def _walker_offsets(num_planes: int, num_satellites_plane: int, relative_phase: float, relative_anom: float) -> tuple:
+    """
+    Fetch the offsets in right ascension and true anomaly of each spacecraft in a Walker constellation, with the
+        spacecraft ordered by plane and then by their position in the plane. These depend only on the shape and
+        phasing of the constellation and so are cached between calls
+    :param num_planes: the number of orbital planes
+    :param num_satellites_plane: the number of spacecraft in each plane
+    :param relative_phase: the offset in true anomaly between spacecraft in adjacent planes
+    :param relative_anom: the offset in true anomaly between adjacent spacecraft in the same plane
+    :return: the offsets in right ascension and in true anomaly of each spacecraft, as read-only arrays
+    """
+    # the offsets are calculated once per plane and once per in-plane position, and then expanded to every spacecraft
+    plane_index = np.arange(num_planes)
+    plane_position = np.arange(num_satellites_plane)
+    right_ascension_offsets = np.repeat(_TWO_PI / num_planes * plane_index, num_satellites_plane)
+    true_anomaly_offsets = np.add.outer(relative_phase * plane_index, relative_anom * plane_position).ravel()
+    right_ascension_offsets.flags.writeable = False
+    true_anomaly_offsets.flags.writeable = False
+    return right_ascension_offsets, true_anomaly_offsets
+
+
+def _convert_elements(elements: np.ndarray, mean_to_osculating: bool, planet: str = "earth") -> tuple:
+    """
+    Convert an (N, 6) array of classical orbital elements between their mean and osculating values in a single batch
+    :param elements: the (N, 6) array of classical orbital elements, with the columns ordered as _ELEMENT_KEYS
+    :param mean_to_osculating: whether to convert from mean to osculating elements, otherwise osculating to mean
+    :param planet: the name of the planet the spacecraft are orbiting
+    :return: the six arrays of converted classical orbital elements
+    """
+    req, j2 = _planet_req_j2(planet)
+    return mean_to_osculating_elements_batch(req, j2, *elements.T, mean_to_osculating=mean_to_osculating)
 
 
 def classical_elements_mean(mean_to_osculating=False):
@@ -51,59 +127,299 @@ def classical_elements_mean(mean_to_osculating=False):
     def decorator(method):
         def wrapper(self, *args, **kwargs):
             orbital_elements = method(self, *args, **kwargs)
-            planet = kwargs.get("planet", "earth")
-            req = get_planet_property(planet, "REQ")
-            j2 = get_planet_property(planet, "J2")
-            # define the keys that will be used to access the orbital elements
-            keys = (
-                "semi_major_axis",
-                "eccentricity",
-                "inclination",
-                "right_ascension",
-                "argument_of_periapsis",
-                "true_anomaly",
+            # gather the orbital elements of every spacecraft into columns and convert them all in a single batch
+            elements = self._elements_array(orbital_elements)
+            converted = np.stack(
+                _convert_elements(elements, mean_to_osculating, kwargs.get("planet", "earth")),
+                axis=-1
             )
-            # use dictionary comprehension to efficiently convert between mean and osculating orbital elements or
-            #   vice versa
-            return {
-                # use dictionary comprehension to map the keys to their respective orbital elements
-                i: {keys[j]: el for j, el in enumerate(
-                    mean_to_osculating_elements(
-                        req=req,
-                        j2=j2,
-                        semi_major_axis=elements["semi_major_axis"],
-                        eccentricity=elements["eccentricity"],
-                        inclination=elements["inclination"],
-                        right_ascension=elements["right_ascension"],
-                        argument_of_periapsis=elements["argument_of_periapsis"],
-                        true_anomaly=elements["true_anomaly"],
-                        mean_to_osculating=mean_to_osculating,
-                    )
-                )} for i, elements in orbital_elements.items()
-            }
+            # map the keys to their respective orbital elements for each spacecraft
+            return {i: dict(zip(_ELEMENT_KEYS, row)) for i, row in zip(orbital_elements, converted.tolist())}
         return wrapper
     return decorator
 
 
+class SpacecraftElements(dict):
+    """
+    A dictionary view of a single spacecraft in a constellation. The classical orbital elements are read from and
+        written to the spacecraft's row of the constellation's element array, while any other variables are kept on
+        the view itself. An orbital element that has not been set is stored as NaN and is treated as missing. The view
+        is a dict so that it can be used anywhere the spacecraft's dictionary could be, such as in json.dumps, with
+        every dict method reading through the view
+    """
+
+    __slots__ = ("_constellation", "_index", "_variables")
+
+    def __init__(self, constellation, index: int):
+        """
+        initialize the view of a spacecraft
+        :param constellation: the constellation that owns the element array
+        :type constellation: Constellation
+        :param index: the row of the spacecraft in the element array
+        :type index: int
+        """
+        # the underlying dict only ever holds the keys of the orbital elements, so that code which checks the size of
+        #   a dict directly before reading it through its methods, such as the json encoder, never sees it as empty
+        super().__init__(_ELEMENT_PLACEHOLDERS)
+        self._constellation = constellation
+        self._index = index
+        # the dictionary of other variables is only created once one is set, as most spacecraft have none
+        self._variables = None
+
+    def __getitem__(self, key):
+        column = _ELEMENT_INDEX.get(key)
+        if column is None:
+            if self._variables is None:
+                raise KeyError(key)
+            return self._variables[key]
+        value = float(self._constellation._elements[self._index, column])
+        if math.isnan(value):
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        column = _ELEMENT_INDEX.get(key)
+        if column is None:
+            if self._variables is None:
+                self._variables = dict()
+            self._variables[key] = value
+        else:
+            self._constellation._elements[self._index, column] = value
+            self._constellation._dirty = True
+
+    def __delitem__(self, key):
+        column = _ELEMENT_INDEX.get(key)
+        if column is None:
+            if self._variables is None:
+                raise KeyError(key)
+            del self._variables[key]
+        elif math.isnan(self._constellation._elements[self._index, column]):
+            raise KeyError(key)
+        else:
+            self._constellation._elements[self._index, column] = np.nan
+            self._constellation._dirty = True
+
+    def __iter__(self):
+        row = self._constellation._elements[self._index]
+        for column, key in enumerate(_ELEMENT_KEYS):
+            if not math.isnan(row[column]):
+                yield key
+        if self._variables is not None:
+            yield from self._variables
+
+    def __len__(self):
+        num_elements = int(np.count_nonzero(~np.isnan(self._constellation._elements[self._index])))
+        return num_elements if self._variables is None else num_elements + len(self._variables)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+    # the dict methods all read the underlying dict directly, so they are replaced by the mapping methods, which go
+    #   through the view
+    __contains__ = Mapping.__contains__
+    __eq__ = Mapping.__eq__
+    keys = Mapping.keys
+    items = Mapping.items
+    values = Mapping.values
+    get = Mapping.get
+    pop = MutableMapping.pop
+    popitem = MutableMapping.popitem
+    clear = MutableMapping.clear
+    update = MutableMapping.update
+    setdefault = MutableMapping.setdefault
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reversed__(self):
+        return reversed(list(self))
+
+    def __or__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        merged = dict(self)
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other):
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        merged = dict(other)
+        merged.update(self)
+        return merged
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return SpacecraftElements._restore, (self._constellation, self._index, self._variables)
+
+    @staticmethod
+    def _restore(constellation, index: int, variables: Optional[dict]):
+        """
+        recreate a view when it is copied or unpickled along with its constellation
+        :param constellation: the constellation that owns the element array
+        :param index: the row of the spacecraft in the element array
+        :param variables: the variables other than the orbital elements
+        :return: the view of the spacecraft
+        """
+        view = SpacecraftElements(constellation, index)
+        view._variables = variables
+        return view
+
+    def copy(self) -> dict:
+        """
+        get a copy of the spacecraft's variables that is independent of the constellation
+        :return: the spacecraft's variables
+        :rtype: dict
+        """
+        return dict(self)
+
+
+class SpacecraftDictionary(dict):
+    """
+    The dictionary of the spacecraft in a constellation, keyed by the spacecraft id. Assigning or deleting a
+        spacecraft goes through the constellation, so that the spacecraft stay in step with its element array
+    """
+
+    __slots__ = ("_constellation",)
+
+    def __init__(self, constellation, spacecraft: dict):
+        """
+        initialize the dictionary of spacecraft
+        :param constellation: the constellation that owns the spacecraft
+        :type constellation: Constellation
+        :param spacecraft: the spacecraft, keyed by the spacecraft id
+        :type spacecraft: dict
+        """
+        super().__init__(spacecraft)
+        self._constellation = constellation
+
+    def __setitem__(self, key, value):
+        self._constellation[key] = value
+
+    def __delitem__(self, key):
+        del self._constellation[key]
+
+    # the dict methods that change the dictionary write to it directly, so they are replaced by the mapping methods,
+    #   which go through the constellation
+    pop = MutableMapping.pop
+    popitem = MutableMapping.popitem
+    clear = MutableMapping.clear
+    update = MutableMapping.update
+    setdefault = MutableMapping.setdefault
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def __reduce__(self):
+        return SpacecraftDictionary, (self._constellation, dict(self))
+
+
+class StateVectors(Mapping):
+    """
+    A read-only dictionary of the inertial state vectors of every spacecraft in a constellation, keyed by the
+        spacecraft id. The position and velocity vectors of all the spacecraft are held in two contiguous (N, 3)
+        arrays, and the dictionary of a single spacecraft is only built when that spacecraft is looked up
+    """
+
+    __slots__ = ("_rows", "r_bn_n", "v_bn_n")
+
+    def __init__(self, spacecraft_ids, r_bn_n: np.ndarray, v_bn_n: np.ndarray):
+        """
+        initialize the state vectors of the spacecraft
+        :param spacecraft_ids: the spacecraft ids, in the order of the rows of the arrays. A range of ids starting at
+            zero is used positionally, without building a lookup of the rows
+        :param r_bn_n: the (N, 3) array of inertial position vectors of the spacecraft
+        :type r_bn_n: np.ndarray
+        :param v_bn_n: the (N, 3) array of inertial velocity vectors of the spacecraft
+        :type v_bn_n: np.ndarray
+        """
+        if isinstance(spacecraft_ids, range) and spacecraft_ids.start == 0 and spacecraft_ids.step == 1:
+            self._rows = spacecraft_ids
+        else:
+            self._rows = {spacecraft_id: row for row, spacecraft_id in enumerate(spacecraft_ids)}
+        self.r_bn_n = r_bn_n
+        self.v_bn_n = v_bn_n
+
+    def __getitem__(self, spacecraft_id) -> dict:
+        if isinstance(self._rows, range):
+            try:
+                row = self._rows.index(spacecraft_id)
+            except ValueError:
+                raise KeyError(spacecraft_id) from None
+        else:
+            row = self._rows[spacecraft_id]
+        return {"r_bn_n": self.r_bn_n[row], "v_bn_n": self.v_bn_n[row]}
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, spacecraft_id):
+        return spacecraft_id in self._rows
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def iter_vectors(self):
+        """
+        iterate over the state vectors of every spacecraft without building a dictionary for each spacecraft
+        :return: an iterator over the spacecraft id, inertial position and inertial velocity of every spacecraft
+        """
+        for row, spacecraft_id in enumerate(self._rows):
+            yield spacecraft_id, self.r_bn_n[row], self.v_bn_n[row]
+
+
 class Constellation(ABC):
 
-    _spacecraft: Dict[int, Dict] = None
+    # the attributes are held in slots rather than a per-instance dictionary; their defaults are assigned on init
+    __slots__ = (
+        "_spacecraft",
+        "_elements",
+        "_synced",
+        "_dirty",
+        "_state_cache",
+        "_num_satellites",
+        "_semi_major_axis",
+        "_eccentricity",
+        "_inclination",
+        "_right_ascension",
+        "_argument_of_periapsis",
+        "_true_anomaly_offset",
+    )
+
+    _spacecraft: Dict[int, SpacecraftElements]
+    # the (N, 6) array of classical orbital elements of every spacecraft, with the columns ordered as _ELEMENT_KEYS
+    _elements: np.ndarray
+    # whether the spacecraft dictionary holds exactly the views of the rows of the element array
+    _synced: bool
+    # whether the orbital elements or the constellation parameters have changed since the elements were initialized
+    _dirty: bool
+    # the orbital elements and the state vectors last calculated from them by each of the state vector methods, keyed
+    #   by the method and its arguments
+    _state_cache: dict
 
     # the number of satellites in the constellation. There must be at least one spacecraft in the constellation
-    _num_satellites: int = None
+    _num_satellites: int
 
     # the semi-major axis of every spacecraft in the co-planar constellation
-    _semi_major_axis: float = None
+    _semi_major_axis: float
     # the eccentricity of every spacecraft in the co-planar constellation
-    _eccentricity: float = 0.0
+    _eccentricity: float
     # the inclination of every spacecraft in the co-planar constellation
-    _inclination: float = None
+    _inclination: float
     # the right ascension of every spacecraft in the co-planar constellation
-    _right_ascension: float = 0.0
+    _right_ascension: float
     # the argument of periapsis of every spacecraft in the co-planar constellation
-    _argument_of_periapsis: float = 0.0
+    _argument_of_periapsis: float
     # the reference true anomaly offset of every spacecraft in the co-planar constellation
-    _true_anomaly_offset: float = 0.0
+    _true_anomaly_offset: float
 
     @property
     def num_satellites(self) -> int:
@@ -129,6 +445,7 @@ class Constellation(ABC):
         if num_satellites < 1:
             raise ValueError
         self._num_satellites = num_satellites
+        self._dirty = True
 
     @property
     def semi_major_axis(self) -> float:
@@ -148,14 +465,8 @@ class Constellation(ABC):
         :param semi_major_axis: the semi-major axis of every spacecraft in the constellation
         :type semi_major_axis: float
         """
-        try:
-            semi_major_axis = float(semi_major_axis)
-        except Exception as e:
-            raise TypeError
-        # ensure the semi-major axis is greater than 0
-        if semi_major_axis < 0:
-            raise ValueError
-        self._semi_major_axis = semi_major_axis
+        self._semi_major_axis = _as_positive_float(semi_major_axis)
+        self._dirty = True
 
     @property
     def eccentricity(self) -> float:
@@ -175,14 +486,8 @@ class Constellation(ABC):
         :param eccentricity: the eccentricity of every spacecraft in the constellation
         :type eccentricity: float
         """
-        try:
-            eccentricity = float(eccentricity)
-        except Exception as e:
-            raise TypeError
-        # ensure the eccentricity is greater than 0
-        if eccentricity < 0:
-            raise ValueError
-        self._eccentricity = eccentricity
+        self._eccentricity = _as_positive_float(eccentricity)
+        self._dirty = True
 
     @property
     def inclination(self) -> float:
@@ -202,11 +507,8 @@ class Constellation(ABC):
         :param inclination: the inclination of every spacecraft in the constellation [rad]
         :type inclination: float
         """
-        try:
-            inclination = float(inclination)
-        except Exception as e:
-            raise TypeError
-        self._inclination = inclination
+        self._inclination = _as_float(inclination)
+        self._dirty = True
 
     @property
     def right_ascension(self) -> float:
@@ -226,11 +528,8 @@ class Constellation(ABC):
         :param right_ascension: the right ascension of every spacecraft in the constellation [rad]
         :type right_ascension: float
         """
-        try:
-            right_ascension = float(right_ascension)
-        except Exception as e:
-            raise TypeError
-        self._right_ascension = right_ascension
+        self._right_ascension = _as_float(right_ascension)
+        self._dirty = True
 
     @property
     def argument_of_periapsis(self) -> float:
@@ -250,11 +549,8 @@ class Constellation(ABC):
         :param argument_of_periapsis: the argument of periapsis of every spacecraft in the constellation [rad]
         :type argument_of_periapsis: float
         """
-        try:
-            argument_of_periapsis = float(argument_of_periapsis)
-        except Exception as e:
-            raise TypeError
-        self._argument_of_periapsis = argument_of_periapsis
+        self._argument_of_periapsis = _as_float(argument_of_periapsis)
+        self._dirty = True
 
     @property
     def true_anomaly_offset(self) -> float:
@@ -274,11 +570,8 @@ class Constellation(ABC):
         :param true_anomaly_offset: the true anomaly offset of every spacecraft in the constellation [rad]
         :type true_anomaly_offset: float
         """
-        try:
-            true_anomaly_offset = float(true_anomaly_offset)
-        except Exception as e:
-            raise TypeError
-        self._true_anomaly_offset = true_anomaly_offset
+        self._true_anomaly_offset = _as_float(true_anomaly_offset)
+        self._dirty = True
 
     @property
     def spacecraft(self) -> dict:
@@ -299,6 +592,83 @@ class Constellation(ABC):
         if not isinstance(spacecraft, dict):
             raise TypeError
         self._spacecraft = spacecraft
+        self._synced = False
+        self._dirty = True
+
+    @property
+    def elements(self) -> np.recarray:
+        """
+        get the classical orbital elements of every spacecraft as a record array with a named field for each element,
+            such as elements.semi_major_axis. While the spacecraft are views of the constellation's element array the
+            records share its memory, so whole fields can be written in one assignment, and the constellation is marked
+            as changed whenever they are fetched. Otherwise the records are a copy of the spacecraft's elements
+        :return: the orbital elements of every spacecraft, in the order of the spacecraft dictionary
+        :rtype: np.recarray
+        """
+        elements = self._elements_array(self._spacecraft)
+        if elements is self._elements:
+            self._dirty = True
+        return elements.view(_ELEMENT_DTYPE).reshape(-1).view(np.recarray)
+
+    def _allocate_spacecraft(self, num_satellites: int):
+        """
+        allocate the element array and the views of its rows for every spacecraft in the constellation. Any variables
+            other than the orbital elements are carried over from the existing spacecraft with the same id
+        :param num_satellites: the number of satellites in the constellation
+        :type num_satellites: int
+        """
+        previous = self._spacecraft or dict()
+        self._elements = np.full((num_satellites, len(_ELEMENT_KEYS)), np.nan)
+        self._spacecraft = SpacecraftDictionary(self, {i: SpacecraftElements(self, i) for i in range(num_satellites)})
+        # only the existing spacecraft are checked for variables to carry over, and the views are recognised by their
+        #   exact type, as an abstract base class check on every spacecraft is far slower than creating the views
+        for i, spacecraft in previous.items():
+            view = self._spacecraft.get(i)
+            if view is None:
+                continue
+            if type(spacecraft) is SpacecraftElements:
+                if spacecraft._variables is not None:
+                    view._variables = dict(spacecraft._variables)
+            elif isinstance(spacecraft, Mapping):
+                view.update({key: value for key, value in spacecraft.items() if key not in _ELEMENT_INDEX})
+        self._synced = True
+        self._dirty = True
+
+    def _elements_array(self, orbital_elements: dict) -> np.ndarray:
+        """
+        get the classical orbital elements of a collection of spacecraft as an (N, 6) array. The constellation's own
+            spacecraft are returned directly from the element array, while any other collection is stacked in order
+        :param orbital_elements: the orbital elements of each spacecraft, keyed by the spacecraft id
+        :type orbital_elements: dict
+        :return: the (N, 6) array of classical orbital elements
+        :rtype: np.ndarray
+        """
+        if orbital_elements is self._spacecraft and self._synced:
+            return self._elements
+        return np.array(
+            [[elements[key] for key in _ELEMENT_KEYS] for elements in orbital_elements.values()],
+            dtype=np.float64
+        ).reshape(-1, len(_ELEMENT_KEYS))
+
+    def _clear_dirty(self):
+        """
+        mark the orbital elements as up to date with the constellation, dropping any state vectors that were cached
+            before the last change
+        """
+        if self._dirty:
+            self._state_cache.clear()
+            self._dirty = False
+
+    def _ensure_elements(self) -> np.ndarray:
+        """
+        get the element array of the constellation, reallocating it if the number of satellites has changed or the
+            spacecraft have been replaced
+        :return: the (N, 6) array of classical orbital elements
+        :rtype: np.ndarray
+        """
+        if not self._synced or self._elements.shape[0] != self.num_satellites:
+            self._allocate_spacecraft(self.num_satellites)
+        return self._elements
 
     def __init__(self, init_classical_elements=False, **kwargs):
         """
@@ -324,6 +694,18 @@ class Constellation(ABC):
         :param kwargs:
         """
         super().__init__()
+        self._spacecraft = None
+        self._elements = None
+        self._synced = False
+        self._dirty = True
+        self._state_cache = dict()
+        self._num_satellites = None
+        self._semi_major_axis = None
+        self._eccentricity = 0.0
+        self._inclination = None
+        self._right_ascension = 0.0
+        self._argument_of_periapsis = 0.0
+        self._true_anomaly_offset = 0.0
         self.num_satellites = kwargs.get("num_satellites", 1)
         if "semi_major_axis" in kwargs:
             self.semi_major_axis = kwargs.get("semi_major_axis")
@@ -337,10 +719,8 @@ class Constellation(ABC):
             self.argument_of_periapsis = kwargs.get("argument_of_periapsis")
         if "true_anomaly_offset" in kwargs:
             self.true_anomaly_offset = kwargs.get("true_anomaly_offset")
-        # initialize the spacecraft dictionary
-        self.spacecraft = {}
-        for i in range(self.num_satellites):
-            self.spacecraft[i] = dict()
+        # initialize the element array and the spacecraft dictionary
+        self._allocate_spacecraft(self.num_satellites)
         # initialize the orbital elements for every spacecraft in the constellation
         if init_classical_elements:
             self.init_classical_elements(**kwargs)
@@ -384,9 +764,7 @@ class Constellation(ABC):
             raise ValueError("Cannot set the mean orbital elements if the argument_of_periapsis is None")
         if true_anomaly_mean is None:
             raise ValueError("Cannot set the mean orbital elements if the true_anomaly is None")
-        planet = kwargs.get("planet", "earth")
-        req = get_planet_property(planet, "REQ")
-        j2 = get_planet_property(planet, "J2")
+        req, j2 = _planet_req_j2(kwargs.get("planet", "earth"))
         # convert the mean to their equivalent osculating orbital elements so they can be stored
         elements_osculating = mean_to_osculating_elements(
             req=req,
@@ -437,29 +815,72 @@ class Constellation(ABC):
         """
         return self.init_classical_elements(*args, **kwargs)
 
-    @state_vectors
     def init_state_vectors(self, *args, **kwargs):
         """
         initialize the inertial state vectors for every spacecraft in the constellation
         :return:
         """
-        return self.init_classical_elements()
+        return self._state_vectors("init_state_vectors", None, args, kwargs)
 
-    @state_vectors
     def init_state_vectors_mean(self, *args, **kwargs):
         """
         initialize the mean inertial state vectors for every spacecraft in the constellation
         :return:
         """
-        return self.init_classical_elements_mean(*args, **kwargs)
+        return self._state_vectors("init_state_vectors_mean", False, args, kwargs)
 
-    @state_vectors
     def init_state_vectors_osculating(self, *args, **kwargs):
         """
         initialize the osculating inertial state vectors for every spacecraft in the constellation
         :return:
         """
-        return self.init_classical_elements_osculating(*args, **kwargs)
+        return self._state_vectors("init_state_vectors_osculating", True, args, kwargs)
+
+    def _state_vectors(self, name: str, mean_to_osculating: Optional[bool], args: tuple, kwargs: dict) -> StateVectors:
+        """
+        initialize the orbital elements for every spacecraft and convert them into their inertial state vectors in a
+            single batch. If mean_to_osculating is given, the orbital elements are first converted between their mean
+            and osculating values, with the converted element arrays passed straight on to the state vector conversion
+        :param name: the name of the state vector method, which the cached state vectors are stored under
+        :param mean_to_osculating: whether to convert the orbital elements from mean to osculating, or from osculating to
+            mean, before calculating the state vectors. If None, the orbital elements are used as they are
+        :param args: the positional arguments of the state vector method
+        :param kwargs: the keyword arguments of the state vector method
+        :return: the state vectors of every spacecraft
+        :rtype: StateVectors
+        """
+        # the orbital elements are always initialized, as a subclass may derive them from parameters of its own that
+        #   the constellation cannot track. Only the conversion into state vectors is skipped when it is cached
+        orbital_elements = self.init_classical_elements(*args, **kwargs)
+        # gather the orbital elements of every spacecraft into columns and convert them all in a single batch
+        elements = self._elements_array(orbital_elements)
+        # only cache the state vectors while every spacecraft is a view of the element array, as changes to any
+        #   other dictionary cannot be tracked
+        key = (name, args, tuple(sorted(kwargs.items()))) \
+            if orbital_elements is self._spacecraft and self._synced else None
+        try:
+            cached = None if key is None else self._state_cache.get(key)
+        except TypeError:
+            key, cached = None, None
+        # return the cached state vectors if they were calculated from exactly the same orbital elements
+        if cached is not None and np.array_equal(cached[0], elements, equal_nan=True):
+            states = cached[1]
+            return StateVectors(states._rows, states.r_bn_n.copy(), states.v_bn_n.copy())
+        if mean_to_osculating is None:
+            columns = elements.T
+        else:
+            columns = _convert_elements(elements, mean_to_osculating, kwargs.get("planet", "earth"))
+        r_bn_n, v_bn_n = classical_to_vector_elements_batch(*columns, *args, **kwargs)
+        # the constellation's own spacecraft are keyed by their row in the element array
+        if orbital_elements is self._spacecraft and self._synced:
+            states = StateVectors(range(len(elements)), r_bn_n, v_bn_n)
+        else:
+            states = StateVectors(orbital_elements, r_bn_n, v_bn_n)
+        # the cache keeps its own copies of the elements and the state vectors, so that every caller is handed arrays
+        #   that it is free to modify
+        if key is not None:
+            self._state_cache[key] = (elements.copy(), StateVectors(states._rows, r_bn_n.copy(), v_bn_n.copy()))
+        return states
 
     def __iter__(self):
         """
@@ -482,14 +903,27 @@ class Constellation(ABC):
         :param key: the spacecraft id
         :param value: the spacecraft
         """
-        self._spacecraft[key] = value
+        # copy into an existing spacecraft's view so that its orbital elements stay in the element array. the value
+        #   is snapshotted before the view is cleared, as it may be the view itself
+        spacecraft = self._spacecraft.get(key)
+        if isinstance(spacecraft, SpacecraftElements):
+            value = dict(value)
+            spacecraft.clear()
+            spacecraft.update(value)
+        else:
+            # the dictionary is written directly, as its own item assignment comes back through this method
+            dict.__setitem__(self._spacecraft, key, value)
+            self._synced = False
+            self._dirty = True
 
     def __delitem__(self, key):
         """
         delete a spacecraft in the constellation
         :param key: the spacecraft id
         """
-        del self._spacecraft[key]
+        dict.__delitem__(self._spacecraft, key)
+        self._synced = False
+        self._dirty = True
 
     def __len__(self):
         """
@@ -538,10 +972,11 @@ class Constellation(ABC):
 
     def __hash__(self):
         """
-        get the hash of the constellation
+        get the hash of the constellation from its identity. A constellation is mutable, so its hash must not depend
+            on its orbital elements, which may change while it is held in a set or as a key
         :return: the hash of the constellation
         """
-        return hash(self._spacecraft)
+        return object.__hash__(self)
 
     def __bool__(self):
         """
@@ -552,10 +987,11 @@ class Constellation(ABC):
 
     def __enter__(self):
         """
-        enter the context of the constellation
+        enter the context of the constellation, initializing the orbital elements unless they are already up to date
         :return: the constellation
         """
-        self.init_classical_elements()
+        if self._dirty:
+            self.init_classical_elements()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -579,9 +1015,23 @@ class Constellation(ABC):
         get the true argument of latitude of the spacecraft in the constellation
         :return: the true argument of latitude of the spacecraft in the constellation
         """
+        # the elements are read by name, which for the constellation's own spacecraft reads the element array
+        spacecraft = self[spacecraft_id]
         return argument_of_latitude(
-            argument_of_periapsis=self[spacecraft_id][4],
-            anomaly=self[spacecraft_id][5],
+            argument_of_periapsis=spacecraft["argument_of_periapsis"],
+            anomaly=spacecraft["true_anomaly"],
+        )
+
+    def true_arguments_of_latitude(self) -> np.ndarray:
+        """
+        get the true argument of latitude of every spacecraft in the constellation in a single batch
+        :return: the true argument of latitude of each spacecraft, in the order of the spacecraft dictionary
+        :rtype: np.ndarray
+        """
+        elements = self._elements_array(self._spacecraft)
+        return argument_of_latitude(
+            argument_of_periapsis=elements[:, _ELEMENT_INDEX["argument_of_periapsis"]],
+            anomaly=elements[:, _ELEMENT_INDEX["true_anomaly"]],
         )
 
     def is_valid_spacecraft_id(self, spacecraft_id: int) -> bool:
@@ -607,24 +1057,41 @@ class Constellation(ABC):
         # if the spacecraft ids are an integer, then convert it to a list
         if isinstance(spacecraft_ids, int):
             spacecraft_ids = [spacecraft_ids]
-        # set the variable for every spacecraft in the constellation
+        if not kwargs:
+            return
+        spacecraft_ids = list(spacecraft_ids)
         for spacecraft_id in spacecraft_ids:
-            for variable, value in kwargs.items():
-                if not self.is_valid_spacecraft_id(spacecraft_id):
-                    raise KeyError(f"The spacecraft id {spacecraft_id} does not exist")
-
-                # if the value is a container, then set the variable for every spacecraft in the constellation
-                if isinstance(value, Container) and not isinstance(value, str):
-                    if len(value) != len(spacecraft_ids):
-                        raise ValueError(f"The length of the value {variable} does not match the number of " +
-                                         f"spacecraft in the constellation {len(self)}")
-                    self[spacecraft_id][variable] = value[spacecraft_id]
+            if not self.is_valid_spacecraft_id(spacecraft_id):
+                raise KeyError(f"The spacecraft id {spacecraft_id} does not exist")
+        # set each variable for every spacecraft in the constellation, deciding once per variable whether the value
+        #   is shared or given per spacecraft
+        for variable, value in kwargs.items():
+            # if the value is a container, then it holds the variable of every spacecraft in the constellation
+            per_spacecraft = isinstance(value, Container) and not isinstance(value, str)
+            if per_spacecraft and len(value) != len(spacecraft_ids):
+                raise ValueError(f"The length of the value {variable} does not match the number of " +
+                                 f"spacecraft in the constellation {len(self)}")
+            # orbital elements are written to the element array in a single assignment, as each spacecraft's id
+            #   is its row in the array
+            column = _ELEMENT_INDEX.get(variable)
+            if column is not None and self._synced:
+                if not per_spacecraft:
+                    values = value
+                elif isinstance(value, np.ndarray):
+                    values = value[spacecraft_ids]
                 else:
-                    self[spacecraft_id][variable] = value
+                    values = [value[spacecraft_id] for spacecraft_id in spacecraft_ids]
+                self._elements[spacecraft_ids, column] = values
+                self._dirty = True
+            else:
+                for spacecraft_id in spacecraft_ids:
+                    self[spacecraft_id][variable] = value[spacecraft_id] if per_spacecraft else value
 
 
 class Coplanar(Constellation):
 
+    __slots__ = ()
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
@@ -633,22 +1100,24 @@ class Coplanar(Constellation):
         initialize the orbital elements for every spacecraft in the constellation
         :return:
         """
-        relative_phase: float = 2 * np.pi / self.num_satellites
-        # use dictionary comprehension to efficiently initialize the orbital elements for every spacecraft in the
-        #   constellation
-        for i in range(self.num_satellites):
-            self.spacecraft[i]["semi_major_axis"] = self.semi_major_axis
-            self.spacecraft[i]["eccentricity"] = self.eccentricity
-            self.spacecraft[i]["inclination"] = self.inclination
-            self.spacecraft[i]["right_ascension"] = self.right_ascension
-            self.spacecraft[i]["argument_of_periapsis"] = self.argument_of_periapsis
-            self.spacecraft[i]["true_anomaly"] = self.true_anomaly_offset + i * relative_phase
+        elements = self._ensure_elements()
+        # every spacecraft shares the same orbit, so the first five columns are broadcast from the constellation and
+        #   only the true anomaly is phased along the orbit
+        elements[:, :5] = (
+            self.semi_major_axis,
+            self.eccentricity,
+            self.inclination,
+            self.right_ascension,
+            self.argument_of_periapsis,
+        )
+        elements[:, 5] = self.true_anomaly_offset + _coplanar_offsets(self.num_satellites)
+        self._clear_dirty()
         return self._spacecraft
 
 
 class CoplanarCircular(Coplanar):
 
-    _eccentricity = 0.0
+    __slots__ = ()
 
     @property
     def eccentricity(self) -> float:
@@ -656,11 +1125,11 @@ class CoplanarCircular(Coplanar):
 
     @eccentricity.setter
     def eccentricity(self, eccentricity: float):
-        self._eccentricity = 0.0
+        # the orbits are always circular, so any eccentricity that is set is ignored without being converted
+        pass
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.eccentricity = 0
 
 
 class Walker(Constellation):
@@ -668,7 +1137,10 @@ class Walker(Constellation):
     A Walker constellation is a constellation of satellites that are evenly spaced in a Walker pattern.
     """
 
-    _num_planes: int = 1
+    __slots__ = ("_num_planes",)
+
+    # the number of orbital planes in the constellation
+    _num_planes: int
 
     @property
     def num_planes(self) -> int:
@@ -694,8 +1166,10 @@ class Walker(Constellation):
         if num_planes < 1:
             raise ValueError
         self._num_planes = num_planes
+        self._dirty = True
 
     def __init__(self, **kwargs):
+        self._num_planes = 1
         super().__init__(**kwargs)
         self.num_planes = kwargs.get("num_planes", 1)
 
@@ -705,7 +1179,10 @@ class WalkerDelta(Walker):
     A Walker Delta constellation is a constellation of satellites that are evenly spaced in a Walker Delta pattern.
     """
 
-    _relative_spacing = 1.0
+    __slots__ = ("_relative_spacing",)
+
+    # the relative phase spacing between spacecraft in adjacent planes
+    _relative_spacing: float
 
     @property
     def relative_spacing(self) -> float:
@@ -723,16 +1200,11 @@ class WalkerDelta(Walker):
         :param relative_spacing: the relative spacing of the constellation
         :type relative_spacing: float
         """
-        try:
-            relative_spacing = float(relative_spacing)
-        except Exception as e:
-            raise TypeError
-        # ensure the relative spacing is greater than 0
-        if relative_spacing < 0:
-            raise ValueError
-        self._relative_spacing = relative_spacing
+        self._relative_spacing = _as_positive_float(relative_spacing)
+        self._dirty = True
 
     def __init__(self, **kwargs):
+        self._relative_spacing = 1.0
         super().__init__(**kwargs)
         self.relative_spacing = kwargs.get("relative_spacing", 1.0)
 
@@ -743,33 +1215,34 @@ class WalkerDelta(Walker):
         :param kwargs:
         :return:
         """
-        if self.num_planes > self.num_satellites:
-            self.num_planes = self.num_satellites
+        # there cannot be more planes than spacecraft, which is applied locally so that the configuration is unchanged
+        num_satellites = self.num_satellites
+        num_planes = min(self.num_planes, num_satellites)
+        # raise an exception if the number of satellites isn't perfectly divisible into the number of planes
+        if num_satellites % num_planes != 0:
+            raise ValueError("The number of satellites should be divisible by the number of planes")
         # define the full rotation
-        full_rotation = 2*np.pi
+        full_rotation = _TWO_PI
         # get the relative spacing parameter which must be within 0 and the number of planes
-        relative_spacing = min(max(abs(self.relative_spacing), 0), self.num_planes)
+        relative_spacing = min(max(abs(self.relative_spacing), 0), num_planes)
         # calculate the relative phase which will determine the phase offset in true anomaly of spacecraft in every
         #   plane
-        relative_phase = relative_spacing * full_rotation / self.num_satellites
+        relative_phase = relative_spacing * full_rotation / num_satellites
         # perform integer division to get the number of satellites per plane as a discrete number
-        num_satellites_plane = self.num_satellites // self.num_planes
+        num_satellites_plane = num_satellites // num_planes
         # calculate the relative anomaly which will determine the difference in true anomaly between every spacecraft
         relative_anom = full_rotation / num_satellites_plane
-        # raise an exception if the number of satellites isn't perfectly divisible into the number of planes
-        if self.num_satellites % self.num_planes != 0:
-            raise ValueError("The number of satellites should be divisible by the number of planes")
-        # set the initial orbital elements for each spacecraft in the constellation
-        for i in range(self.num_planes):
-            for j in range(num_satellites_plane):
-                true_anom = relative_phase * i + relative_anom * j + self.true_anomaly_offset
-                raan = full_rotation / self.num_planes * i + self.right_ascension
-                index = i * num_satellites_plane + j
-                self.spacecraft[index]["semi_major_axis"] = self.semi_major_axis
-                self.spacecraft[index]["eccentricity"] = self.eccentricity
-                self.spacecraft[index]["inclination"] = self.inclination
-                self.spacecraft[index]["right_ascension"] = raan
-                self.spacecraft[index]["argument_of_periapsis"] = self.argument_of_periapsis
-                self.spacecraft[index]["true_anomaly"] = true_anom
+        # set the initial orbital elements for each spacecraft in the constellation, with the spacecraft ordered by
+        #   plane and then by their position in the plane
+        right_ascension_offsets, true_anomaly_offsets = _walker_offsets(
+            num_planes, num_satellites_plane, relative_phase, relative_anom
+        )
+        elements = self._ensure_elements()
+        # the shared elements are broadcast down their columns, while the right ascension varies only by plane
+        elements[:, :3] = (self.semi_major_axis, self.eccentricity, self.inclination)
+        elements[:, 4] = self.argument_of_periapsis
+        elements[:, 3] = right_ascension_offsets + self.right_ascension
+        elements[:, 5] = true_anomaly_offsets + self.true_anomaly_offset
+        self._clear_dirty()
         # return the orbital elements
         return self._spacecraft
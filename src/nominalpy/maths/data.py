@@ -6,9 +6,55 @@
 '''
 This module contains public methods that can calculate various
 data-related functions for the TT&C system. These include bits
-and byte conversions.
+and byte conversions. Whole numbers are converted exactly with
+integer shifts, while fractional quantities are scaled as floats
+and truncated.
 '''
 
+from numbers import Integral
+
+
+_BYTE_SHIFT: int = 3
+'''The power of two of the number of bits in a byte'''
+
+_KILOBYTE_SHIFT: int = 10
+'''The power of two of the number of bytes in a kilobyte'''
+
+_MEGABYTE_SHIFT: int = 20
+'''The power of two of the number of bytes in a megabyte'''
+
+_GIGABYTE_SHIFT: int = 30
+'''The power of two of the number of bytes in a gigabyte'''
+
+
+def _scale (value: float, name: str, shift: int, bit_shift: int = 0) -> int:
+    '''
+    Scale a non-negative quantity up by a power of two. Whole numbers
+    are shifted exactly, while fractional quantities are scaled as
+    floats and truncated before any further bit shift is applied.
+
+    :param value:       The quantity to be converted.
+    :type value:        float
+    :param name:        The name of the quantity, used in error messages.
+    :type name:         str
+    :param shift:       The power of two to scale the quantity by before truncating.
+    :type shift:        int
+    :param bit_shift:   The power of two to scale the truncated quantity by.
+    :type bit_shift:    int
+
+    :return:            The converted quantity.
+    :rtype:             int
+    '''
+    if value < 0:
+        raise ValueError(f"{name} must be a positive float")
+    if isinstance(value, Integral):
+        return int(value) << (shift + bit_shift)
+    try:
+        value = float(value)
+    except TypeError:
+        raise TypeError(f"{name} must be a positive float")
+    return int(value * (1 << shift)) << bit_shift
+
 
 def bytes_to_bits (bytes: float) -> int:
     '''
@@ -22,20 +68,13 @@ def bytes_to_bits (bytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype: int    
     '''
-    if bytes < 0:
-        raise ValueError("bytes must be a positive float")
-    try:
-        bytes = float(bytes)
-    except TypeError:
-        raise TypeError("bytes must be a positive float")
-    return int(bytes * 8)
+    return _scale(bytes, "bytes", _BYTE_SHIFT)
 
 
 def kilobytes_to_bytes (kilobytes: float) -> int:
     '''
-    Convert a quantity from kilobytes to bytes. This function 
-    uses the `bytes_to_bytes` function for the conversion, considering
-    that 1 kilobyte equals 1024 bytes.
+    Convert a quantity from kilobytes to bytes, considering that
+    1 kilobyte equals 1024 bytes.
 
     :param kilobytes:   The number of kilobytes to be converted.
     :type kilobytes:    float
@@ -43,20 +82,13 @@ def kilobytes_to_bytes (kilobytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype:             int
     '''
-    if kilobytes < 0:
-        raise ValueError("kilobytes must be a positive float")
-    try:
-        kilobytes = float(kilobytes)
-    except TypeError:
-        raise TypeError("kilobytes must be a positive float")
-    return int(kilobytes * 1024)
+    return _scale(kilobytes, "kilobytes", _KILOBYTE_SHIFT)
 
 
 def megabytes_to_bytes (megabytes: float) -> int:
     '''
-    Convert a quantity from megabytes to bytes. This function uses the 
-    `kilobytes_to_bytes` function for the conversion, considering
-    that 1 megabyte equals 1024 kilobytes
+    Convert a quantity from megabytes to bytes, considering that
+    1 megabyte equals 1024 kilobytes.
 
     :param megabytes:   The number of megabytes to be converted.
     :type megabytes:    float
@@ -64,14 +96,13 @@ def megabytes_to_bytes (megabytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype:             int
     '''
-    return kilobytes_to_bytes(megabytes * 1024)
+    return _scale(megabytes, "megabytes", _MEGABYTE_SHIFT)
 
 
 def gigabytes_to_bytes (gigabytes: float) -> int:
     '''
-    Convert a quantity from gigabytes to bytes. This function uses 
-    the `megabytes_to_bytes` function for the conversion, considering
-    that 1 gigabyte equals 1024 megabytes.
+    Convert a quantity from gigabytes to bytes, considering that
+    1 gigabyte equals 1024 megabytes.
 
     :param gigabytes:   The number of gigabytes to be converted.
     :type gigabytes:    float
@@ -79,14 +110,14 @@ def gigabytes_to_bytes (gigabytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype:             int
     '''
-    return megabytes_to_bytes(gigabytes * 1024)
+    return _scale(gigabytes, "gigabytes", _GIGABYTE_SHIFT)
 
 
 def kilobytes_to_bits (kilobytes: float) -> int:
     '''
-    Convert a quantity from kilobytes to bits.  This function 
-    uses the `bytes_to_bits` function for the conversion, considering
-    that 1 kilobyte equals 1024 bytes.
+    Convert a quantity from kilobytes to bits, considering that
+    1 kilobyte equals 1024 bytes. The kilobytes are truncated to
+    whole bytes before being converted to bits.
 
     :param kilobytes:   The number of kilobytes to be converted.
     :type kilobytes:    float
@@ -94,12 +125,13 @@ def kilobytes_to_bits (kilobytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype:             int
     '''
-    return bytes_to_bits(kilobytes_to_bytes(kilobytes))
+    return _scale(kilobytes, "kilobytes", _KILOBYTE_SHIFT, _BYTE_SHIFT)
 
 
 def megabytes_to_bits (megabytes: float) -> int:
     '''
-    Convert a quantity from megabytes to bits.
+    Convert a quantity from megabytes to bits. The megabytes are
+    truncated to whole bytes before being converted to bits.
 
     :param megabytes:   The number of megabytes to be converted.
     :type megabytes:    float
@@ -107,12 +139,13 @@ def megabytes_to_bits (megabytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype:             int
     '''
-    return bytes_to_bits(megabytes_to_bytes(megabytes))
+    return _scale(megabytes, "megabytes", _MEGABYTE_SHIFT, _BYTE_SHIFT)
 
 
 def gigabytes_to_bits (gigabytes: float) -> int:
     '''
-    Convert a quantity from gigabytes to bits.
+    Convert a quantity from gigabytes to bits. The gigabytes are
+    truncated to whole bytes before being converted to bits.
 
     :param gigabytes:   The number of gigabytes to be converted.
     :type gigabytes:    float
@@ -120,4 +153,4 @@ def gigabytes_to_bits (gigabytes: float) -> int:
     :return:            The equivalent number of bits.
     :rtype:             int
     '''
-    return bytes_to_bits(gigabytes_to_bytes(gigabytes))
+    return _scale(gigabytes, "gigabytes", _GIGABYTE_SHIFT, _BYTE_SHIFT)
@@ -3,9 +3,38 @@
 # to the public API. All code is under the the license provided along
 # with the 'nominalpy' module. Copyright Nominal Systems, 2024.
 
+import math
 import numpy as np
 
 
+def _basis_vector(*components: float) -> np.ndarray:
+    """
+    Creates a read-only vector, so the module level constants cannot be modified by callers.
+
+    :param components: The components of the vector.
+    :return: The read-only vector.
+    """
+    vector = np.array(components, dtype=np.float64)
+    vector.setflags(write=False)
+    return vector
+
+
+_E1: np.ndarray = _basis_vector(1.0, 0.0, 0.0)
+'''The unit vector along the X-axis, used as the right axis'''
+
+_E2: np.ndarray = _basis_vector(0.0, 1.0, 0.0)
+'''The unit vector along the Y-axis, used as the forward axis'''
+
+_E3: np.ndarray = _basis_vector(0.0, 0.0, 1.0)
+'''The unit vector along the Z-axis, used as the up axis'''
+
+_NEG_E1: np.ndarray = _basis_vector(-1.0, 0.0, 0.0)
+'''The unit vector along the negative X-axis'''
+
+_NEG_E3: np.ndarray = _basis_vector(0.0, 0.0, -1.0)
+'''The unit vector along the negative Z-axis'''
+
+
 def to_dcm(right: np.ndarray = None, forward: np.ndarray = None, up: np.ndarray = None) -> np.ndarray:
     """
     Converts the DCM to a new DCM using the provided vectors.
@@ -17,19 +46,30 @@ def to_dcm(right: np.ndarray = None, forward: np.ndarray = None, up: np.ndarray
     """
     # Normalize the input vectors
     if right is not None and forward is not None and up is not None:
-        axis_u = up / np.linalg.norm(up)
-        axis_r = right / np.linalg.norm(right)
-        axis_f = forward / np.linalg.norm(forward)
-
-        # Assign matrix components
-        M = np.array([
-            [axis_r[0], axis_f[0], axis_u[0]],
-            [axis_r[1], axis_f[1], axis_u[1]],
-            [axis_r[2], axis_f[2], axis_u[2]]
-        ])
-    else:
-        # Default to identity matrix if no vectors are provided
-        M = np.eye(3)
+        return to_dcm_unchecked(
+            right / np.linalg.norm(right),
+            forward / np.linalg.norm(forward),
+            up / np.linalg.norm(up)
+        )
+    # Default to identity matrix if no vectors are provided
+    return np.eye(3)
+
+
+def to_dcm_unchecked(right: np.ndarray, forward: np.ndarray, up: np.ndarray) -> np.ndarray:
+    """
+    Creates a DCM from the provided vectors without normalizing them. This skips
+    the norm calculations of to_dcm, so the vectors must already be unit vectors.
+
+    :param right: A unit vector representing the right axis.
+    :param forward: A unit vector representing the forward axis.
+    :param up: A unit vector representing the up axis.
+    :return: The new DCM.
+    """
+    # Assign the axes to the matrix columns
+    M = np.empty((3, 3))
+    M[:, 0] = right
+    M[:, 1] = forward
+    M[:, 2] = up
     return M
 
 
@@ -40,33 +80,50 @@ def up_axis_to_dcm(up: np.ndarray) -> np.ndarray:
     :param up: The up axis to align with.
     :return: The DCM aligned to the up axis.
     """
-    right_vec = np.array([1, 0, 0])
-    forward_vec = np.array([0, 1, 0])
-    up_vec = np.array([0, 0, 1])
-
     # Skip if a zero vector
-    if np.linalg.norm(up) == 0:
+    x = float(up[0])
+    y = float(up[1])
+    z = float(up[2])
+    norm = math.sqrt(x * x + y * y + z * z)
+    if norm == 0:
         raise ValueError("Zero vector provided for up axis.")
 
     # Check if vectors are aligned
-    check = np.dot(right_vec, up)
+    check = x
 
     # Aligned with up axis
     if check >= 1 - 1e-15:
-        return to_dcm(-up_vec, forward_vec, right_vec)
+        return to_dcm_unchecked(_NEG_E3, _E2, _E1)
 
     # Anti-aligned with up axis (down axis)
     if check <= -1 + 1e-15:
-        return to_dcm(up_vec, forward_vec, -right_vec)
-
-    # Calculate the axis
-    up_norm = up / np.linalg.norm(up)
-    forward = np.cross(up_norm, right_vec)
-    right = np.cross(forward, up)
-
-    # Return the matrix
-    return to_dcm(right, forward, up)
-
+        return to_dcm_unchecked(_E3, _E2, _NEG_E1)
+
+    # Calculate the axis, normalizing the forward axis so that all three axes are unit vectors.
+    #   As the right vector is the X-axis, forward = up_norm x e1 = (0, up_norm[2], -up_norm[1])
+    #   and the cross products are written out with scalars.
+    ux = x / norm
+    uy = y / norm
+    uz = z / norm
+    forward_norm = math.sqrt(uy * uy + uz * uz)
+    if forward_norm == 0:
+        # A short vector along the X-axis, which the checks above do not catch
+        return to_dcm_unchecked(_NEG_E3, _E2, _E1) if x > 0 else to_dcm_unchecked(_E3, _E2, _NEG_E1)
+    fy = uz / forward_norm
+    fz = -uy / forward_norm
+
+    # Return the matrix, with the right axis as forward x up_norm
+    M = np.empty((3, 3))
+    M[0,0] = fy * uz - fz * uy
+    M[1,0] = fz * ux
+    M[2,0] = -fy * ux
+    M[0,1] = 0.0
+    M[1,1] = fy
+    M[2,1] = fz
+    M[0,2] = ux
+    M[1,2] = uy
+    M[2,2] = uz
+    return M
 
 def mrp_to_dcm(mrp: np.ndarray) -> np.ndarray:
     """
@@ -76,24 +133,60 @@ def mrp_to_dcm(mrp: np.ndarray) -> np.ndarray:
     :return: The DCM representation of the MRP.
     """
 
-    q1 = mrp[0]
-    q2 = mrp[1]
-    q3 = mrp[2]
-
-    d1 = np.dot(mrp,mrp)
-    s = 1-d1
-    d = (1 + d1) * (1 + d1)
-    c = np.identity(3)
-    c[0,0] = 4 * (2 * q1 * q1 - d1) + s * s
-    c[0,1] = 8 * q1 * q2 + 4 * q3 * s
-    c[0,2] = 8 * q1 * q3 - 4 * q2 * s
-    c[1,0] = 8 * q2 * q1 - 4 * q3 * s
-    c[1,1] = 4 * (2 * q2 * q2 - d1) + s * s
-    c[1,2] = 8 * q2 * q3 + 4 * q1 * s
-    c[2,0] = 8 * q3 * q1 + 4 * q2 * s
-    c[2,1] = 8 * q3 * q2 - 4 * q1 * s
-    c[2,2] = 4 * (2 * q3 * q3 - d1) + s * s
-    c *= 1/d
+    # Work on plain floats, as the NumPy dispatch outweighs the arithmetic for a single MRP
+    q1 = float(mrp[0])
+    q2 = float(mrp[1])
+    q3 = float(mrp[2])
+
+    d1 = q1 * q1 + q2 * q2 + q3 * q3
+    s = 1 - d1
+    inv_d = 1 / ((1 + d1) * (1 + d1))
+
+    # Every entry is written, so the matrix does not need to be initialised
+    c = np.empty((3, 3))
+    c[0,0] = (4 * (2 * q1 * q1 - d1) + s * s) * inv_d
+    c[0,1] = (8 * q1 * q2 + 4 * q3 * s) * inv_d
+    c[0,2] = (8 * q1 * q3 - 4 * q2 * s) * inv_d
+    c[1,0] = (8 * q2 * q1 - 4 * q3 * s) * inv_d
+    c[1,1] = (4 * (2 * q2 * q2 - d1) + s * s) * inv_d
+    c[1,2] = (8 * q2 * q3 + 4 * q1 * s) * inv_d
+    c[2,0] = (8 * q3 * q1 + 4 * q2 * s) * inv_d
+    c[2,1] = (8 * q3 * q2 - 4 * q1 * s) * inv_d
+    c[2,2] = (4 * (2 * q3 * q3 - d1) + s * s) * inv_d
+
+    return c
+
+
+def mrp_to_dcm_batch(mrps: np.ndarray) -> np.ndarray:
+    """
+    Converts N Modified Rodrigues Parameters (MRPs) to Direction Cosine Matrices (DCMs)
+    in a single vectorized pass. The conversion is otherwise identical to mrp_to_dcm.
+
+    :param mrps: The (N, 3) array of MRPs to convert.
+    :type mrps: numpy.ndarray
+    :return: The (N, 3, 3) array of DCMs.
+    :rtype: numpy.ndarray
+    """
+    mrps = np.asarray(mrps, dtype=np.float64)
+    q1 = mrps[:, 0]
+    q2 = mrps[:, 1]
+    q3 = mrps[:, 2]
+
+    d1 = q1 * q1 + q2 * q2 + q3 * q3
+    s = 1 - d1
+    inv_d = 1 / ((1 + d1) * (1 + d1))
+    s_sq = s * s
+
+    c = np.empty((len(mrps), 3, 3))
+    c[:, 0, 0] = (4 * (2 * q1 * q1 - d1) + s_sq) * inv_d
+    c[:, 0, 1] = (8 * q1 * q2 + 4 * q3 * s) * inv_d
+    c[:, 0, 2] = (8 * q1 * q3 - 4 * q2 * s) * inv_d
+    c[:, 1, 0] = (8 * q2 * q1 - 4 * q3 * s) * inv_d
+    c[:, 1, 1] = (4 * (2 * q2 * q2 - d1) + s_sq) * inv_d
+    c[:, 1, 2] = (8 * q2 * q3 + 4 * q1 * s) * inv_d
+    c[:, 2, 0] = (8 * q3 * q1 + 4 * q2 * s) * inv_d
+    c[:, 2, 1] = (8 * q3 * q2 - 4 * q1 * s) * inv_d
+    c[:, 2, 2] = (4 * (2 * q3 * q3 - d1) + s_sq) * inv_d
 
     return c
 
@@ -107,13 +200,18 @@ def euler2(angle_rad: float) -> np.ndarray:
     :return: 3x3 rotation matrix about the Y-axis.
     :rtype: numpy.ndarray
     """
-    cos_x = np.cos(angle_rad)
-    sin_x = np.sin(angle_rad)
-    rotation_matrix = np.array([
-        [cos_x, 0.0, sin_x],
-        [0.0,   1.0, 0.0],
-        [-sin_x, 0.0, cos_x]
-    ])
+    cos_x = math.cos(angle_rad)
+    sin_x = math.sin(angle_rad)
+    rotation_matrix = np.empty((3, 3))
+    rotation_matrix[0,0] = cos_x
+    rotation_matrix[0,1] = 0.0
+    rotation_matrix[0,2] = sin_x
+    rotation_matrix[1,0] = 0.0
+    rotation_matrix[1,1] = 1.0
+    rotation_matrix[1,2] = 0.0
+    rotation_matrix[2,0] = -sin_x
+    rotation_matrix[2,1] = 0.0
+    rotation_matrix[2,2] = cos_x
     return rotation_matrix
 
 def euler3(angle_rad: float) -> np.ndarray:
@@ -125,11 +223,16 @@ def euler3(angle_rad: float) -> np.ndarray:
     :return: 3x3 rotation matrix about the Z-axis.
     :rtype: numpy.ndarray
     """
-    cos_x = np.cos(angle_rad)
-    sin_x = np.sin(angle_rad)
-    rotation_matrix = np.array([
-        [cos_x, -sin_x, 0.0],
-        [sin_x,  cos_x, 0.0],
-        [0.0,    0.0,   1.0]
-    ])
+    cos_x = math.cos(angle_rad)
+    sin_x = math.sin(angle_rad)
+    rotation_matrix = np.empty((3, 3))
+    rotation_matrix[0,0] = cos_x
+    rotation_matrix[0,1] = -sin_x
+    rotation_matrix[0,2] = 0.0
+    rotation_matrix[1,0] = sin_x
+    rotation_matrix[1,1] = cos_x
+    rotation_matrix[1,2] = 0.0
+    rotation_matrix[2,0] = 0.0
+    rotation_matrix[2,1] = 0.0
+    rotation_matrix[2,2] = 1.0
     return rotation_matrix
@@ -135,7 +135,7 @@ def tensor_matrix(tensor: np.ndarray, dcm: np.ndarray) -> np.ndarray:
     :return: The transformed tensor [3x3 matrix]
     :rtype: numpy.ndarray
     """
-    return np.dot(dcm.T, np.dot(tensor, dcm))
+    return _tensor_transform_x3(tensor, dcm)
 
 
 def tensor_transform(tensor: np.ndarray, dcm: np.ndarray) -> np.ndarray:
@@ -149,7 +149,23 @@ def tensor_transform(tensor: np.ndarray, dcm: np.ndarray) -> np.ndarray:
     :return: The transformed tensor in the new frame [3x3 matrix]
     :rtype: numpy.ndarray
     """
-    return dcm.T @ tensor @ dcm
+    return _tensor_transform_x3(tensor, dcm)
+
+
+def _tensor_transform_x3(tensor: np.ndarray, dcm: np.ndarray) -> np.ndarray:
+    """
+    Computes dcm.T @ tensor @ dcm for 3x3 matrices. Two direct np.dot calls have the
+    least dispatch overhead at this size, being faster than the matmul operator and
+    than unrolling the 54 products in Python.
+
+    :param tensor: A rank-2 tensor in the original frame [3x3 matrix]
+    :type tensor: numpy.ndarray
+    :param dcm: The DCM for the frame transformation [-]
+    :type dcm: numpy.ndarray
+    :return: The transformed tensor in the new frame [3x3 matrix]
+    :rtype: numpy.ndarray
+    """
+    return np.dot(dcm.T, np.dot(tensor, dcm))
 
 
 def inertia_point_transform(inertia: np.ndarray, dcm: np.ndarray, position: np.ndarray, mass: float) -> np.ndarray:
@@ -167,9 +183,21 @@ def inertia_point_transform(inertia: np.ndarray, dcm: np.ndarray, position: np.n
     :return: The transformed inertia tensor in the new frame [3x3 matrix]
     :rtype: numpy.ndarray
     """
-    i_parallel = tensor_matrix(inertia, dcm)
-    r_tilde = skew_matrix(position)
-    return i_parallel - mass * np.dot(r_tilde, r_tilde)
+    i_parallel = _tensor_transform_x3(inertia, dcm)
+
+    # Subtract the parallel axis term, writing out r_tilde @ r_tilde = p p^T - (p.p) I
+    # directly rather than building the skew matrix and multiplying it by itself
+    x = float(position[0])
+    y = float(position[1])
+    z = float(position[2])
+    xy = mass * x * y
+    xz = mass * x * z
+    yz = mass * y * z
+    return i_parallel + (
+        (mass * (y * y + z * z), -xy, -xz),
+        (-xy, mass * (x * x + z * z), -yz),
+        (-xz, -yz, mass * (x * x + y * y))
+    )
 
 
 def inertia_inverse_point_transform(inertia: np.ndarray, dcm: np.ndarray, position: np.ndarray,
@@ -190,7 +218,7 @@ def inertia_inverse_point_transform(inertia: np.ndarray, dcm: np.ndarray, positi
     """
     r_tilde = skew_matrix(position)
     i_parallel = inertia + mass * np.dot(r_tilde, r_tilde)
-    return tensor_transform(i_parallel, dcm)
+    return _tensor_transform_x3(i_parallel, dcm)
 
 
 def inertia_prime_point_transform(inertia_prime: np.ndarray, dcm: np.ndarray, position: np.ndarray,
@@ -212,7 +240,7 @@ def inertia_prime_point_transform(inertia_prime: np.ndarray, dcm: np.ndarray, po
     :rtype: numpy.ndarray
     """
     # Transform InertiaPrime to a frame parallel to the target frame
-    i_parallel = tensor_matrix(inertia_prime, dcm)
+    i_parallel = _tensor_transform_x3(inertia_prime, dcm)
 
     # Compute skew matrices for the position and position rate (position_dot)
     r_tilde = skew_matrix(position)
@@ -231,8 +259,14 @@ def skew_matrix(vector: np.ndarray) -> np.ndarray:
     :return: The skew-symmetric matrix [3x3 matrix]
     :rtype: numpy.ndarray
     """
-    return np.array([
-        [0, -vector[2], vector[1]],
-        [vector[2], 0, -vector[0]],
-        [-vector[1], vector[0], 0]
-    ])
+    matrix = np.empty((3, 3))
+    matrix[0,0] = 0.0
+    matrix[0,1] = -vector[2]
+    matrix[0,2] = vector[1]
+    matrix[1,0] = vector[2]
+    matrix[1,1] = 0.0
+    matrix[1,2] = -vector[0]
+    matrix[2,0] = -vector[1]
+    matrix[2,1] = vector[0]
+    matrix[2,2] = 0.0
+    return matrix
@@ -11,6 +11,13 @@ calculations and astrophysical dimensions.
 import numpy as np
 
 
+_TRIG_LUT_SIZE: int = 1024
+'''The number of intervals over one revolution in the approximate sine lookup table'''
+
+_SIN_LUT: np.ndarray = np.sin(np.linspace(0.0, 2 * np.pi, _TRIG_LUT_SIZE + 1))
+'''The sine of evenly spaced angles over one revolution, including both end points'''
+
+
 def acos_quadrant_check(adjacent: float, hypotenuse: float, test: float) -> float:
     """
     Calculate an angle using the arccosine function and perform a 
@@ -59,36 +66,80 @@ def normalize_angle(angle: float | np.ndarray, angle_max: float = 2*np.pi) -> fl
     >>> normalize_angle(np.array([-3.0, 0.0, 6.5, 12.0, -9.0]), angle_max=360)
     array([357. ,   0. ,   6.5,  12. , 351. ])
     """
-    angle = np.fmod(angle, angle_max)
-    # Add the angle max if the angle is negative. Handle for both scalar and array angles
+    # The floored modulo takes the sign of angle_max, so negative angles wrap without a branch.
+    #   Handle for both scalar and array angles
     if np.isscalar(angle):
-        if angle < 0:
-            angle += angle_max
-    else:
-        angle[angle < 0] += angle_max
-    return angle
+        return float(angle) % angle_max
+    return np.remainder(angle, angle_max)
+
+
+def fast_sin(angle: float | np.ndarray) -> float | np.ndarray:
+    """
+    Calculate an approximate sine of an angle or array of angles using linear
+    interpolation into a 1024 entry lookup table. The absolute error is below
+    5e-6, so this is only suitable for low-accuracy work such as visualization
+    or coarse grids of orbits, where many angles are needed cheaply.
+
+    :param angle:   The angle (float) or array of angles (numpy.ndarray) in radians
+    :type angle:    float or numpy.ndarray
+
+    :returns:       The approximate sine of the angle
+    :rtype:         float or numpy.ndarray
+    """
+    # Find the table interval and the fraction of the way through it
+    x = np.asarray(angle, dtype=np.float64) * (_TRIG_LUT_SIZE / (2 * np.pi))
+    x_floor = np.floor(x)
+    frac = x - x_floor
+    index = x_floor.astype(np.int64) % _TRIG_LUT_SIZE
+    # Interpolate between the neighbouring table entries
+    lower = _SIN_LUT[index]
+    result = lower + frac * (_SIN_LUT[index + 1] - lower)
+    # Handle for both scalar and array angles
+    if np.isscalar(angle):
+        return float(result)
+    return result
+
+
+def fast_cos(angle: float | np.ndarray) -> float | np.ndarray:
+    """
+    Calculate an approximate cosine of an angle or array of angles from the
+    sine lookup table, see fast_sin for the accuracy of the approximation.
+
+    :param angle:   The angle (float) or array of angles (numpy.ndarray) in radians
+    :type angle:    float or numpy.ndarray
+
+    :returns:       The approximate cosine of the angle
+    :rtype:         float or numpy.ndarray
+    """
+    # The cosine is the sine shifted forward by a quarter revolution. Handle for both scalar and array angles
+    if np.isscalar(angle):
+        return fast_sin(angle + 0.5 * np.pi)
+    return fast_sin(np.asarray(angle, dtype=np.float64) + 0.5 * np.pi)
 
 
-def shortest_angular_difference(angle1: float, angle2: float) -> float:
+def shortest_angular_difference(angle1: float | np.ndarray, angle2: float | np.ndarray) -> float | np.ndarray:
     """
-    Calculate the shortest angular difference between two angles. This function
-    calculates the shortest angular difference between two angles using the
-    arccosine function and the quadrant check function.
+    Calculate the shortest angular difference between two angles or arrays of
+    angles. This function compares the direct difference between the angles with
+    the alternative difference going the other way around the circle and returns
+    whichever has the smallest magnitude.
 
-    :param angle1:  The first angle
-    :type angle1:   float
-    :param angle2:  The second angle
-    :type angle2:   float
+    :param angle1:  The first angle (float) or array of angles (numpy.ndarray)
+    :type angle1:   float or numpy.ndarray
+    :param angle2:  The second angle (float) or array of angles (numpy.ndarray)
+    :type angle2:   float or numpy.ndarray
 
     :returns:       The shortest angular difference between the two angles
-    :rtype:         float
+    :rtype:         float or numpy.ndarray
     """
     # Calculate the difference between the two angles
-    d_angle: float = angle1 - angle2
+    d_angle = angle1 - angle2
     # Get the alternative angle
-    alt_angle: float = -np.sign(d_angle) * (2 * np.pi - np.fabs(d_angle))
-    # Return the shortest angle
-    return alt_angle if np.fabs(alt_angle) < np.fabs(d_angle) else d_angle
+    alt_angle = -np.sign(d_angle) * (2 * np.pi - np.fabs(d_angle))
+    # Return the shortest angle. Handle for both scalar and array angles
+    if np.isscalar(d_angle):
+        return alt_angle if np.fabs(alt_angle) < np.fabs(d_angle) else d_angle
+    return np.where(np.fabs(alt_angle) < np.fabs(d_angle), alt_angle, d_angle)
 
 
 def normalize_array(array: np.ndarray) -> np.ndarray:
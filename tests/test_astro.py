@@ -0,0 +1,132 @@
+#                     [ NOMINAL SYSTEMS ]
+# This code is developed by Nominal Systems to aid with communication
+# to the public API. All code is under the the license provided along
+# with the 'nominalpy' module. Copyright Nominal Systems, 2024.
+
+import math
+import numpy as np
+from nominalpy.maths import astro
+
+
+REQ = 6378137.0
+J2 = 1.0826e-3
+
+
+def test_mean_to_osculating_prograde_equatorial ():
+    # the inclination correction is undefined at i = 0, so the angles are nan rather than raising
+    elements = astro.mean_to_osculating_elements(REQ, J2, 7e6, 0.001, 0.0, 0.1, 0.2, 0.3, mean_to_osculating=True)
+    assert math.isfinite(elements[0]) and math.isfinite(elements[1])
+    assert all(math.isnan(x) for x in elements[2:5])
+    batch = astro.mean_to_osculating_elements_batch(
+        REQ, J2, 7e6, 0.001, np.array([0.0]), 0.1, 0.2, 0.3, mean_to_osculating=True)
+    assert np.isnan(batch[2][0])
+
+
+def test_mean_to_osculating_retrograde_equatorial ():
+    elements = astro.mean_to_osculating_elements(REQ, J2, 7e6, 0.001, math.pi, 0.1, 0.2, 0.3, mean_to_osculating=True)
+    assert all(math.isfinite(x) for x in elements)
+    assert math.isclose(elements[2], math.pi)
+    batch = astro.mean_to_osculating_elements_batch(
+        REQ, J2, 7e6, 0.001, np.array([math.pi]), 0.1, 0.2, 0.3, mean_to_osculating=True)
+    assert np.allclose([x[0] for x in batch], elements)
+
+
+def test_vector_to_classical_elements_mean_equatorial ():
+    for inclination in (0.0, math.pi):
+        elements = astro.vector_to_classical_elements_mean(
+            *astro.classical_to_vector_elements(7e6, 0.001, inclination, 0.1, 0.2, 0.3))
+        assert math.isclose(elements[0], 7e6, rel_tol=1e-5)
+
+
+def test_mean_to_osculating_hyperbolic ():
+    elements = astro.mean_to_osculating_elements(REQ, J2, 7e6, 1.5, 0.5, 0.1, 0.2, 0.3, mean_to_osculating=True)
+    assert all(math.isnan(x) for x in elements)
+
+
+def test_t_lvlh_eci_integer_input ():
+    # integer components must not overflow in the angular momentum products
+    dcm = astro.t_lvlh_eci(np.array([7000000, 0, 0]), np.array([0, 7500, 0]))
+    assert np.allclose(dcm, np.eye(3))
+
+
+def test_mean_to_true_anomaly_at_periapsis ():
+    # a mean anomaly at periapsis is the root itself and must not wrap to 2*pi for highly eccentric orbits
+    eccentricities = np.array([0.5, 0.9, 0.95, 0.99])
+    for mean_anomaly in (0.0, 2 * math.pi, 4 * math.pi):
+        for eccentricity in eccentricities:
+            assert astro.mean_to_true_anomaly(mean_anomaly, eccentricity) == 0.0
+            assert astro.mean_to_eccentric_anomaly(mean_anomaly, eccentricity) == 0.0
+        assert np.all(astro._mean_to_true_anomaly_array(np.full(4, mean_anomaly), eccentricities) == 0.0)
+    # a subnormal mean anomaly stays just after periapsis
+    for mean_anomaly in (1e-300, 5e-324):
+        for eccentricity in eccentricities:
+            assert 0.0 <= astro.mean_to_true_anomaly(mean_anomaly, eccentricity) < 1e-290
+        true_anomaly = astro._mean_to_true_anomaly_array(np.full(4, mean_anomaly), eccentricities)
+        assert np.all((true_anomaly >= 0.0) & (true_anomaly < 1e-290))
+
+
+# orbits covering each branch of the state vector conversion: elliptical inclined, circular inclined, elliptical
+#   equatorial, circular equatorial and elliptical retrograde equatorial
+ELEMENTS = np.array([
+    [7.0e6, 0.01, 0.5, 0.1, 0.2, 0.3],
+    [7.2e6, 0.0, 1.0, 0.4, 0.0, 2.0],
+    [8.0e6, 0.2, 0.0, 0.0, 1.1, 4.0],
+    [6.9e6, 0.0, 0.0, 0.0, 0.0, 5.5],
+    [9.0e6, 0.3, math.pi, 0.0, 0.7, 1.0],
+])
+
+
+def test_classical_to_vector_elements_batch ():
+    r_bn_n, v_bn_n = astro.classical_to_vector_elements_batch(*ELEMENTS.T)
+    for elements, r, v in zip(ELEMENTS, r_bn_n, v_bn_n):
+        r_scalar, v_scalar = astro.classical_to_vector_elements(*elements)
+        assert np.allclose(r, r_scalar, rtol=1e-14, atol=1e-6)
+        assert np.allclose(v, v_scalar, rtol=1e-14, atol=1e-9)
+    # the states can be written into slices of a larger buffer
+    states = np.zeros((len(ELEMENTS), 6))
+    r_out, v_out = astro.classical_to_vector_elements_batch(*ELEMENTS.T, r_out=states[:, :3], v_out=states[:, 3:])
+    assert np.shares_memory(r_out, states) and np.shares_memory(v_out, states)
+    assert np.array_equal(states, np.hstack((r_bn_n, v_bn_n)))
+    # the approximate trigonometry is accurate to a few parts in 1e5
+    r_fast, v_fast = astro.classical_to_vector_elements_batch(*ELEMENTS.T, use_fast_trig=True)
+    assert np.allclose(r_fast, r_bn_n, rtol=0.0, atol=1e-4 * np.max(np.abs(r_bn_n)))
+    assert np.allclose(v_fast, v_bn_n, rtol=0.0, atol=1e-4 * np.max(np.abs(v_bn_n)))
+
+
+def test_classical_to_vector_elements_into ():
+    r_out, v_out = np.empty(3), np.empty(3)
+    for elements in ELEMENTS:
+        r, v = astro.classical_to_vector_elements_into(r_out, v_out, *elements)
+        assert r is r_out and v is v_out
+        r_scalar, v_scalar = astro.classical_to_vector_elements(*elements)
+        assert np.allclose(r_out, r_scalar, rtol=1e-14, atol=1e-6)
+        assert np.allclose(v_out, v_scalar, rtol=1e-14, atol=1e-9)
+
+
+def test_vector_to_classical_elements_soa_and_batch ():
+    r_bn_n, v_bn_n = astro.classical_to_vector_elements_batch(*ELEMENTS.T)
+    soa = np.stack(astro.vector_to_classical_elements_soa(*r_bn_n.T, *v_bn_n.T), axis=-1)
+    batch = np.stack(astro.vector_to_classical_elements_batch(r_bn_n, v_bn_n), axis=-1)
+    for r, v, soa_elements, batch_elements in zip(r_bn_n, v_bn_n, soa, batch):
+        scalar = np.array(astro.vector_to_classical_elements(r, v))
+        assert np.allclose(soa_elements, scalar, rtol=1e-12, atol=1e-12)
+        assert np.allclose(batch_elements, scalar, rtol=1e-12, atol=1e-12)
+
+
+def test_mean_to_osculating_elements_batch ():
+    for mean_to_osculating in (True, False):
+        batch = np.stack(astro.mean_to_osculating_elements_batch(
+            REQ, J2, *ELEMENTS[:3].T, mean_to_osculating=mean_to_osculating), axis=-1)
+        for elements, batch_elements in zip(ELEMENTS[:3], batch):
+            scalar = astro.mean_to_osculating_elements(REQ, J2, *elements, mean_to_osculating=mean_to_osculating)
+            # the equatorial orbit has nan angles in both
+            assert np.allclose(batch_elements, scalar, rtol=1e-12, atol=1e-12, equal_nan=True)
+
+
+def test_relative_state_lvlh_batch ():
+    r_bn_n, v_bn_n = astro.classical_to_vector_elements_batch(*ELEMENTS.T)
+    batch = astro.relative_state_lvlh_batch(r_bn_n[0], v_bn_n[0], r_bn_n[1:], v_bn_n[1:])
+    assert batch.shape == (len(ELEMENTS) - 1, 6)
+    for r, v, state in zip(r_bn_n[1:], v_bn_n[1:], batch):
+        scalar = astro.relative_state_lvlh(r_bn_n[0], v_bn_n[0], r, v)
+        assert np.allclose(state, scalar, rtol=1e-12, atol=1e-6)
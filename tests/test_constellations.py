@@ -0,0 +1,72 @@
+#                     [ NOMINAL SYSTEMS ]
+# This code is developed by Nominal Systems to aid with communication
+# to the public API. All code is under the the license provided along
+# with the 'nominalpy' module. Copyright Nominal Systems, 2024.
+
+import json
+import numpy as np
+from nominalpy.maths.constellations import Coplanar
+
+
+def test_setitem_with_own_view ():
+    # assigning a spacecraft back to itself must leave its elements untouched
+    constellation = Coplanar(
+        num_satellites=3, semi_major_axis=7e6, eccentricity=0.001, inclination=0.5, right_ascension=0.1,
+        argument_of_periapsis=0.2, true_anomaly=0.3
+    )
+    constellation.init_classical_elements()
+    elements = dict(constellation[0])
+    constellation[0] = constellation[0]
+    assert dict(constellation[0]) == elements
+
+
+def test_setitem_through_spacecraft_dictionary ():
+    # assigning through the public dictionary must keep the spacecraft in step with the element array
+    constellation = Coplanar(num_satellites=3, semi_major_axis=7e6, inclination=0.5)
+    constellation.spacecraft[0] = {"mass": 5.0}
+    constellation.init_classical_elements()
+    assert constellation.spacecraft[0]["mass"] == 5.0
+    assert constellation.spacecraft[0]["semi_major_axis"] == 7e6
+    del constellation.spacecraft[2]
+    assert 2 not in constellation
+
+
+def test_spacecraft_are_dictionaries ():
+    constellation = Coplanar(num_satellites=2, semi_major_axis=7e6, inclination=0.5)
+    constellation.set_variable(mass=5.0)
+    constellation.init_classical_elements()
+    assert isinstance(constellation.spacecraft, dict)
+    assert isinstance(constellation.spacecraft[0], dict)
+    decoded = json.loads(json.dumps(constellation.spacecraft))
+    assert decoded["1"] == dict(constellation[1])
+    assert decoded["1"]["mass"] == 5.0
+
+
+class _SpreadCoplanar (Coplanar):
+
+    __slots__ = ("spread",)
+
+    def __init__(self, **kwargs):
+        self.spread = 0.0
+        super().__init__(**kwargs)
+
+    def init_classical_elements(self, *args, **kwargs):
+        spacecraft = super().init_classical_elements(*args, **kwargs)
+        self._elements[:, 3] += self.spread * np.arange(self.num_satellites)
+        return spacecraft
+
+
+def test_state_vectors_follow_subclass_parameters ():
+    # a parameter that the constellation does not know about must still invalidate the cached state vectors
+    constellation = _SpreadCoplanar(
+        num_satellites=3, semi_major_axis=7e6, eccentricity=0.001, inclination=0.5, right_ascension=0.2
+    )
+    before = constellation.init_state_vectors()
+    constellation.spread = 1.0
+    after = constellation.init_state_vectors()
+    assert constellation[2]["right_ascension"] == 2.2
+    assert np.allclose(after[0]["r_bn_n"], before[0]["r_bn_n"])
+    assert not np.allclose(after[2]["r_bn_n"], before[2]["r_bn_n"])
+    # with nothing changed, the cached state vectors are returned as copies
+    again = constellation.init_state_vectors()
+    assert np.array_equal(again.r_bn_n, after.r_bn_n) and again.r_bn_n is not after.r_bn_n
@@ -0,0 +1,20 @@
+#                     [ NOMINAL SYSTEMS ]
+# This code is developed by Nominal Systems to aid with communication
+# to the public API. All code is under the the license provided along
+# with the 'nominalpy' module. Copyright Nominal Systems, 2024.
+
+import numpy as np
+from nominalpy.maths import kinematics
+
+
+def test_mrp_to_dcm_batch ():
+    mrps = np.array([
+        [0.0, 0.0, 0.0],
+        [0.1, -0.2, 0.3],
+        [0.5, 0.5, -0.5],
+        [-0.9, 0.1, 0.2],
+    ])
+    dcms = kinematics.mrp_to_dcm_batch(mrps)
+    assert dcms.shape == (len(mrps), 3, 3)
+    for mrp, dcm in zip(mrps, dcms):
+        assert np.allclose(dcm, kinematics.mrp_to_dcm(mrp), rtol=0.0, atol=1e-15)
@@ -0,0 +1,16 @@
+#                     [ NOMINAL SYSTEMS ]
+# This code is developed by Nominal Systems to aid with communication
+# to the public API. All code is under the the license provided along
+# with the 'nominalpy' module. Copyright Nominal Systems, 2024.
+
+import numpy as np
+from nominalpy.maths import utils
+
+
+def test_fast_sin_and_cos ():
+    angles = np.linspace(-10.0, 10.0, 10001)
+    assert np.max(np.abs(utils.fast_sin(angles) - np.sin(angles))) < 5e-6
+    assert np.max(np.abs(utils.fast_cos(angles) - np.cos(angles))) < 5e-6
+    # scalar angles return floats
+    assert isinstance(utils.fast_sin(1.0), float) and abs(utils.fast_sin(1.0) - np.sin(1.0)) < 5e-6
+    assert isinstance(utils.fast_cos(1.0), float) and abs(utils.fast_cos(1.0) - np.cos(1.0)) < 5e-6